@@ -6,14 +6,19 @@ backlog = 2048
 
 # Worker processes
 workers = int(os.environ.get('WEB_CONCURRENCY', 2))
-worker_class = 'sync'
+# Threads park in the admission queue (python/admission.py); ADMISSION_CAPACITY
+# of them run at once, so keep threads well above it
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 16))
 worker_connections = 1000
 timeout = 30
 keepalive = 60
 
-# Restart workers after this many requests to prevent memory leaks
-max_requests = 1000
-max_requests_jitter = 50
+# Worker recycling is off by default: in-process stores have byte budgets
+# (python/memory_budget.py) and /api/admin/memory reports growth.
+# Set GUNICORN_MAX_REQUESTS to re-enable it as a safety net.
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = 50 if max_requests else 0
 
 # Logging
 accesslog = '-'
@@ -33,4 +38,34 @@ tmp_upload_dir = None
 
 # SSL
 keyfile = None
-certfile = None
\ No newline at end of file
+certfile = None
+
+
+def when_ready(server):
+    # Build the shared read-only state in the master, then stop the collector there
+    # so nothing moves between now and the fork (the master allocates very little)
+    import gc
+    import server as app_server
+    app_server.preload()
+    gc.collect()
+    gc.disable()
+
+
+def pre_fork(server, worker):
+    # Move everything allocated so far into the permanent generation; workers'
+    # collections then never write to (and copy) the preloaded pages
+    import gc
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    import gc
+    gc.enable()
+
+
+def post_worker_init(worker):
+    # SIGUSR2 to a worker reloads content snapshots between requests
+    # (gunicorn leaves USR2 unused in workers; sending it to the master upgrades the binary)
+    import signal
+    import server
+    signal.signal(signal.SIGUSR2, lambda signum, frame: server.content_snapshots.request_reload())
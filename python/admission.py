@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Admission Control
+Per-worker priority queue in front of expensive routes, with per-class limits and early load shedding
+"""
+
+import heapq
+import itertools
+import math
+import os
+import threading
+from typing import Dict, List, Any, Optional
+
+# Request classes, highest priority first
+PRIORITY_CLASSES = {'premium': 0, 'free': 1, 'batch': 2}
+
+# Requests running at once in one worker; scans are CPU bound, so keep this near 1-2 per core
+DEFAULT_CAPACITY = int(os.environ.get('ADMISSION_CAPACITY', 2))
+
+# Longest queue wait (seconds) each class accepts before it is shed
+DEFAULT_MAX_WAIT = {
+    'premium': float(os.environ.get('ADMISSION_PREMIUM_MAX_WAIT', 5.0)),
+    'free': float(os.environ.get('ADMISSION_FREE_MAX_WAIT', 2.0)),
+    'batch': float(os.environ.get('ADMISSION_BATCH_MAX_WAIT', 1.0)),
+}
+
+# Smoothing factor of the per-class service time average
+EWMA_ALPHA = 0.2
+
+# Service time assumed before a class has been measured (seconds)
+INITIAL_SERVICE_TIME = 0.1
+
+
+class Overloaded(Exception):
+    """Raised when a request is shed; retry_after is the suggested delay in seconds"""
+
+    def __init__(self, request_class: str, retry_after: float):
+        super().__init__(f'Server busy: {request_class} queue is full')
+        self.request_class = request_class
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+class _Waiter:
+    __slots__ = ('request_class', 'event', 'granted', 'abandoned')
+
+    def __init__(self, request_class: str):
+        self.request_class = request_class
+        self.event = threading.Event()
+        self.granted = False
+        self.abandoned = False
+
+
+class AdmissionController:
+    """Grants execution slots by priority class; estimates queue wait to shed early
+
+    A class may hold at most `limits[class]` of the `capacity` slots, so batch
+    work can never take every slot from interactive requests.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY,
+                 limits: Optional[Dict[str, int]] = None,
+                 max_wait: Optional[Dict[str, float]] = None):
+        self.capacity = capacity
+        self.limits = limits or {'premium': capacity, 'free': capacity, 'batch': max(1, capacity // 2)}
+        self.max_wait = max_wait or dict(DEFAULT_MAX_WAIT)
+        self.service_time = {cls: INITIAL_SERVICE_TIME for cls in PRIORITY_CLASSES}
+        self.running = {cls: 0 for cls in PRIORITY_CLASSES}
+        self.queued = {cls: 0 for cls in PRIORITY_CLASSES}
+        self.admitted = {cls: 0 for cls in PRIORITY_CLASSES}
+        self.shed = {cls: 0 for cls in PRIORITY_CLASSES}
+        self.timed_out = {cls: 0 for cls in PRIORITY_CLASSES}
+        self._heap: List[Any] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def estimate_wait(self, request_class: str) -> float:
+        """Seconds until a new request of this class would start (caller holds the lock)"""
+        priority = PRIORITY_CLASSES[request_class]
+        ahead = sum(
+            self.queued[cls] * self.service_time[cls]
+            for cls, p in PRIORITY_CLASSES.items() if p <= priority
+        )
+        # Work already running drains in parallel with the queue
+        running = sum(n * self.service_time[cls] for cls, n in self.running.items())
+        return (ahead + running) / self.capacity
+
+    def acquire(self, request_class: str) -> None:
+        """Block until a slot is granted; raises Overloaded instead of waiting past the SLO"""
+        waiter = _Waiter(request_class)
+        with self._lock:
+            heapq.heappush(self._heap, (PRIORITY_CLASSES[request_class], next(self._sequence), waiter))
+            self.queued[request_class] += 1
+            self._dispatch()
+            if waiter.granted:
+                return
+            estimate = self.estimate_wait(request_class)
+            if estimate > self.max_wait[request_class]:
+                waiter.abandoned = True
+                self.queued[request_class] -= 1
+                self.shed[request_class] += 1
+                raise Overloaded(request_class, estimate)
+
+        if waiter.event.wait(self.max_wait[request_class]):
+            return
+        with self._lock:
+            if waiter.granted:
+                return
+            waiter.abandoned = True
+            self.queued[request_class] -= 1
+            self.timed_out[request_class] += 1
+            estimate = self.estimate_wait(request_class)
+        raise Overloaded(request_class, estimate)
+
+    def release(self, request_class: str, elapsed: float) -> None:
+        """Return a slot, fold the service time into the average and wake the next waiters"""
+        with self._lock:
+            self.running[request_class] -= 1
+            self.service_time[request_class] += EWMA_ALPHA * (elapsed - self.service_time[request_class])
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the highest-priority waiters whose class is under its limit"""
+        blocked = []
+        while self._heap and sum(self.running.values()) < self.capacity:
+            entry = heapq.heappop(self._heap)
+            waiter = entry[2]
+            if waiter.abandoned:
+                continue
+            if self.running[waiter.request_class] >= self.limits[waiter.request_class]:
+                blocked.append(entry)
+                continue
+            waiter.granted = True
+            self.queued[waiter.request_class] -= 1
+            self.running[waiter.request_class] += 1
+            self.admitted[waiter.request_class] += 1
+            waiter.event.set()
+        for entry in blocked:
+            heapq.heappush(self._heap, entry)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'capacity': self.capacity,
+                'classes': {
+                    cls: {
+                        'running': self.running[cls],
+                        'queued': self.queued[cls],
+                        'limit': self.limits[cls],
+                        'max_wait_seconds': self.max_wait[cls],
+                        'service_time_seconds': round(self.service_time[cls], 4),
+                        'estimated_wait_seconds': round(self.estimate_wait(cls), 4),
+                        'admitted': self.admitted[cls],
+                        'shed': self.shed[cls],
+                        'timed_out': self.timed_out[cls]
+                    }
+                    for cls in PRIORITY_CLASSES
+                }
+            }
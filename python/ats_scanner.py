@@ -7,12 +7,22 @@ Analyzes resume content for ATS compatibility and provides optimization suggesti
 import json
 import sys
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Set, Tuple
 import textstat
 from collections import Counter
 
+from skill_recommender import SkillRecommender
+from industry_classifier import IndustryClassifier
+from text_normalizer import PhraseMatcher, normalize_text, normalize_many
+
+# Below this classifier confidence the keyword-count heuristic decides
+INDUSTRY_CONFIDENCE_THRESHOLD = 0.5
+
 class ATSScanner:
-    def __init__(self):
+    def __init__(self, recommender: Optional[SkillRecommender] = None,
+                 classifier: Optional[IndustryClassifier] = None,
+                 industry_keywords: Optional[Dict[str, List[str]]] = None,
+                 required_sections: Optional[List[str]] = None):
         # Industry-specific keywords database
         self.industry_keywords = {
             'tech': [
@@ -42,6 +52,24 @@ class ATSScanner:
         self.required_sections = [
             'experience', 'education', 'skills', 'contact', 'summary'
         ]
+        
+        # Taxonomy overrides from a content snapshot
+        if industry_keywords is not None:
+            self.industry_keywords = industry_keywords
+        if required_sections is not None:
+            self.required_sections = required_sections
+        
+        # Taxonomy terms in stemmed form, normalized once per snapshot
+        self.all_keywords = list(dict.fromkeys(
+            keyword for keywords in self.industry_keywords.values() for keyword in keywords
+        ))
+        self.keyword_matcher = PhraseMatcher(self.all_keywords)
+        
+        # Ranks missing keywords; taxonomy order is kept when no matrix is built
+        self.skill_recommender = recommender or SkillRecommender.load_default()
+        
+        # Trained industry model; the keyword heuristic is used when absent
+        self.industry_classifier = classifier or IndustryClassifier.load_default()
     
     def extract_text(self, content: Dict[str, Any]) -> str:
         """Extract all text from resume content"""
@@ -73,16 +101,44 @@ class ATSScanner:
             else:
                 text_parts.append(str(content['skills']))
         
+        # Unrecognised sections from segmented plain-text resumes (certifications, projects...)
+        if 'other' in content:
+            text_parts.append(content['other'])
+        
         return ' '.join(text_parts).lower()
     
     def detect_industry(self, text: str) -> str:
         """Detect industry based on keywords in resume"""
+        return self.detect_industries([text])[0][0]
+    
+    def detect_industries(self, texts: List[str],
+                          present: Optional[List[Set[str]]] = None) -> List[Tuple[str, Optional[float]]]:
+        """Detect (industry, confidence) for many texts with one classifier call
+        
+        `present` holds each text's taxonomy match when the caller already has it.
+        """
+        matches = present or [None] * len(texts)
+        if self.industry_classifier is None:
+            return [(self.detect_industry_by_keywords(text, found), None) for text, found in zip(texts, matches)]
+        
+        detected = []
+        predictions = self.industry_classifier.predict(texts)
+        for text, found, (industry, confidence) in zip(texts, matches, predictions):
+            if confidence < INDUSTRY_CONFIDENCE_THRESHOLD:
+                industry = self.detect_industry_by_keywords(text, found)
+            detected.append((industry, confidence))
+        return detected
+    
+    def detect_industry_by_keywords(self, text: str, present: Optional[Set[str]] = None) -> str:
+        """Fallback heuristic: count taxonomy keyword hits per industry"""
         industry_scores = {}
+        if present is None:
+            present = self.keyword_matcher.find(normalize_text(text))
         
         for industry, keywords in self.industry_keywords.items():
             if industry == 'general':
                 continue
-            score = sum(1 for keyword in keywords if keyword.lower() in text)
+            score = sum(1 for keyword in keywords if keyword in present)
             industry_scores[industry] = score
         
         # Return industry with highest score, or 'general' if no clear match
@@ -90,20 +146,59 @@ class ATSScanner:
             return max(industry_scores, key=industry_scores.get)
         return 'general'
     
-    def check_keywords(self, text: str, industry: str) -> Dict[str, Any]:
+    def keywords_for_description(self, description: str,
+                                 tokens: Optional[Tuple[str, ...]] = None) -> List[str]:
+        """Collect taxonomy keywords mentioned in a job description"""
+        if tokens is None:
+            tokens = normalize_text(description)
+        present = self.keyword_matcher.find(tokens)
+        return [keyword for keyword in self.all_keywords if keyword in present]
+    
+    def matched_keywords(self, tokens: Tuple[str, ...], keywords: List[str],
+                         present: Optional[Set[str]] = None) -> Set[str]:
+        """Keywords present in normalized resume tokens
+        
+        `present` is the taxonomy match already computed for these tokens;
+        keywords outside the taxonomy are matched with a throwaway matcher.
+        """
+        if present is None:
+            present = self.keyword_matcher.find(tokens)
+        unknown = [keyword for keyword in keywords if keyword not in self.keyword_matcher]
+        if unknown:
+            present = present | PhraseMatcher(unknown).find(tokens)
+        return present
+    
+    def check_keywords(self, text: str, industry: str,
+                       analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Check for relevant keywords based on industry"""
-        relevant_keywords = self.industry_keywords[industry] + self.industry_keywords['general']
+        # Industries the classifier knows but the taxonomy does not fall back to general terms
+        relevant_keywords = self.industry_keywords.get(industry, []) + self.industry_keywords['general']
+        return self.check_keyword_list(text, relevant_keywords, analysis)
+    
+    def check_keyword_list(self, text: str, relevant_keywords: List[str],
+                           analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Check resume text against an explicit keyword list
         
+        Matching is on stemmed tokens, so "managed", "managing" and "management"
+        are one term. Pass the resume analysis to reuse its normalized tokens.
+        """
+        if analysis is not None:
+            present = self.matched_keywords(analysis['tokens'], relevant_keywords, analysis['present'])
+        else:
+            present = self.matched_keywords(normalize_text(text), relevant_keywords)
         found_keywords = []
         missing_keywords = []
         
         for keyword in relevant_keywords:
-            if keyword.lower() in text:
+            if keyword in present:
                 found_keywords.append(keyword)
             else:
                 missing_keywords.append(keyword)
         
-        keyword_score = (len(found_keywords) / len(relevant_keywords)) * 100
+        keyword_score = (len(found_keywords) / len(relevant_keywords)) * 100 if relevant_keywords else 0
+        
+        if self.skill_recommender:
+            missing_keywords = self.skill_recommender.rank(found_keywords, missing_keywords)
         
         return {
             'score': min(keyword_score, 100),
@@ -193,18 +288,82 @@ class ATSScanner:
         
         return suggestions[:8]  # Return top 8 suggestions
     
-    def scan(self, content: Dict[str, Any], job_position: str = 'general') -> Dict[str, Any]:
-        """Main scanning function"""
+    def analyze_resume(self, content: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the job-independent part of a scan once"""
         text = self.extract_text(content)
+        tokens = normalize_text(text)
+        present = self.keyword_matcher.find(tokens)
+        industry, confidence = self.detect_industries([text], [present])[0]
+        return {
+            'text': text,
+            'tokens': tokens,
+            'present': present,
+            'sections': frozenset(section for section, value in content.items() if value),
+            'detected_industry': industry,
+            'industry_confidence': confidence,
+            'structure': self.check_structure(content),
+            'readability': self.check_readability(text)
+        }
+    
+    def score_analysis(self, analysis: Dict[str, Any], job_position: str = 'general',
+                       job_description: str = None,
+                       description_industry: Tuple[str, Optional[float]] = None,
+                       description_tokens: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Score a pre-computed resume analysis against one position or job description"""
+        text = analysis['text']
+        structure_analysis = analysis['structure']
+        readability_analysis = analysis['readability']
+        confidence = None
         
-        # Detect industry if not specified
-        industry = self.detect_industry(text) if job_position == 'general' else job_position.lower()
+        if job_description:
+            job_keywords = self.keywords_for_description(job_description, description_tokens)
+            industry, confidence = description_industry or self.detect_industries([job_description.lower()])[0]
+            if job_keywords:
+                keyword_analysis = self.check_keyword_list(text, job_keywords, analysis)
+            else:
+                keyword_analysis = self.check_keywords(text, industry, analysis)
+        else:
+            # Detect industry if not specified
+            if job_position == 'general':
+                industry, confidence = analysis['detected_industry'], analysis['industry_confidence']
+            else:
+                industry = job_position.lower()
+            keyword_analysis = self.check_keywords(text, industry, analysis)
+        
+        return self.combine_scores(industry, confidence, keyword_analysis, structure_analysis, readability_analysis)
+    
+    def score_profile(self, analysis: Dict[str, Any], profile: Any) -> Dict[str, Any]:
+        """Score a pre-computed resume analysis against a compiled JobProfile
+        
+        The profile's matcher, weights and sections were built when it was
+        compiled, so no job-side work is repeated here.
+        """
+        present = profile.matcher.find(analysis['tokens'])
+        found_keywords = [k for k in profile.keywords if k in present]
+        missing_keywords = [k for k in profile.keywords if k not in present]
+        total_weight = sum(profile.weights.values())
+        keyword_score = sum(profile.weights[k] for k in found_keywords) / total_weight * 100 if total_weight else 0
+        keyword_analysis = {
+            'score': min(keyword_score, 100),
+            'found': found_keywords,
+            'missing': missing_keywords[:10],
+            'total_possible': len(profile.keywords)
+        }
         
-        # Perform analysis
-        keyword_analysis = self.check_keywords(text, industry)
-        structure_analysis = self.check_structure(content)
-        readability_analysis = self.check_readability(text)
+        sections = profile.required_sections
+        present_sections = [s for s in sections if s in analysis['sections']]
+        structure_analysis = {
+            'score': (len(present_sections) / len(sections)) * 100 if sections else 100,
+            'present': present_sections,
+            'missing': [s for s in sections if s not in analysis['sections']]
+        }
         
+        return self.combine_scores(profile.industry, profile.industry_confidence, keyword_analysis,
+                                   structure_analysis, analysis['readability'])
+    
+    def combine_scores(self, industry: str, confidence: Optional[float], keyword_analysis: Dict,
+                       structure_analysis: Dict, readability_analysis: Dict) -> Dict[str, Any]:
+        """Weighted overall score plus suggestions, in the shape scan() returns"""
         # Calculate overall score (weighted average)
         overall_score = int(
             keyword_analysis['score'] * 0.6 +
@@ -218,11 +377,52 @@ class ATSScanner:
         return {
             'score': overall_score,
             'industry': industry,
+            'industry_confidence': confidence,
             'keywords': keyword_analysis,
             'structure': structure_analysis,
             'readability': readability_analysis,
             'suggestions': suggestions
         }
+    
+    def scan(self, content: Dict[str, Any], job_position: str = 'general',
+             job_description: str = None) -> Dict[str, Any]:
+        """Main scanning function"""
+        return self.score_analysis(self.analyze_resume(content), job_position, job_description)
+    
+    def scan_profile(self, content: Dict[str, Any], profile: Any) -> Dict[str, Any]:
+        """Scan against a compiled job profile instead of a raw description"""
+        return self.score_profile(self.analyze_resume(content), profile)
+    
+    def scan_many(self, content: Dict[str, Any], jobs: List[Any]) -> List[Dict[str, Any]]:
+        """Scan one resume against many jobs, best match first
+        
+        Each job is a position name or a dict with 'position' and/or 'description'
+        (plus optional 'id' and 'title'). The resume is analyzed only once.
+        """
+        analysis = self.analyze_resume(content)
+        jobs = [{'position': job} if isinstance(job, str) else job for job in jobs]
+        
+        # Classify and normalize all job descriptions in one batch
+        descriptions = [job['description'].lower() for job in jobs if job.get('description')]
+        description_tokens = normalize_many(descriptions)
+        description_present = [self.keyword_matcher.find(tokens) for tokens in description_tokens]
+        detected = iter(self.detect_industries(descriptions, description_present) if descriptions else [])
+        normalized = iter(description_tokens)
+        
+        results = []
+        for index, job in enumerate(jobs):
+            description_industry = next(detected) if job.get('description') else None
+            description_tokens = next(normalized) if job.get('description') else None
+            result = self.score_analysis(analysis, job.get('position', 'general'), job.get('description'),
+                                         description_industry, description_tokens)
+            result['id'] = job.get('id', str(index))
+            result['title'] = job.get('title', job.get('position', ''))
+            results.append(result)
+        
+        results.sort(key=lambda r: r['score'], reverse=True)
+        for rank, result in enumerate(results, 1):
+            result['rank'] = rank
+        return results
 
 def main():
     try:
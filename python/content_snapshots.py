@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Content Snapshots
+Versioned taxonomy/templates/articles compiled into immutable snapshots and swapped atomically
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+from ats_scanner import ATSScanner
+from single_flight import content_hash
+
+logger = logging.getLogger(__name__)
+
+CONTENT_DIR = os.environ.get(
+    'CONTENT_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'content')
+)
+
+# Built-in data (the code defaults) when no content version is published
+BUILTIN_VERSION = 'builtin'
+
+# How often workers stat the version pointer (seconds)
+CHECK_INTERVAL = 1.0
+
+
+def _validate(taxonomy: Any, templates: Any, articles: Any) -> None:
+    """Reject content the scanner, templates or article routes cannot serve"""
+    if not isinstance(taxonomy, dict):
+        raise ValueError('taxonomy.json must be an object')
+    industry_keywords = taxonomy.get('industry_keywords')
+    if industry_keywords is not None:
+        if not isinstance(industry_keywords, dict) or 'general' not in industry_keywords:
+            raise ValueError('industry_keywords must be an object with a "general" entry')
+        for industry, keywords in industry_keywords.items():
+            if not isinstance(keywords, list) or not all(isinstance(k, str) and k for k in keywords):
+                raise ValueError(f'industry_keywords.{industry} must be a list of strings')
+    required_sections = taxonomy.get('required_sections')
+    if required_sections is not None and (
+            not isinstance(required_sections, list) or not required_sections
+            or not all(isinstance(s, str) for s in required_sections)):
+        raise ValueError('required_sections must be a non-empty list of strings')
+    if not isinstance(templates, list) or not all(isinstance(t, dict) and 'id' in t for t in templates):
+        raise ValueError('templates.json must be a list of objects with an "id"')
+    if not isinstance(articles, list) or not all(isinstance(a, dict) for a in articles):
+        raise ValueError('articles.json must be a list of objects')
+
+
+class Snapshot:
+    """One consistent version of the reloadable data; never mutated after creation"""
+
+    __slots__ = ('version', 'digest', 'taxonomy_digest', 'scanner', 'templates', 'articles', 'loaded_at')
+
+    def __init__(self, version: str, digest: str, taxonomy_digest: str, scanner: ATSScanner,
+                 templates: Tuple[Dict[str, Any], ...], articles: Tuple[Dict[str, Any], ...]):
+        self.version = version
+        # Hash of the loaded data: changes when files are edited in place, unlike the version name
+        self.digest = digest
+        # Hash of the taxonomy alone, the only input to scan results; keys scan caches and job profiles
+        self.taxonomy_digest = taxonomy_digest
+        self.scanner = scanner
+        self.templates = templates
+        self.articles = articles
+        self.loaded_at = time.time()
+
+
+class SnapshotStore:
+    """Holds the current snapshot; readers grab a reference and keep using it
+
+    Layout of the content directory:
+        current                  -- name of the active version
+        <version>/taxonomy.json  -- {"industry_keywords": {...}, "required_sections": [...]}
+        <version>/templates.json -- list of templates
+        <version>/articles.json  -- list of seeded articles
+    Any missing file falls back to the built-in data.
+    """
+
+    def __init__(self, builtin: Dict[str, Any], directory: str = CONTENT_DIR,
+                 check_interval: float = CHECK_INTERVAL):
+        self.builtin = builtin
+        self.directory = directory
+        self.pointer_path = os.path.join(directory, 'current')
+        self.check_interval = check_interval
+        self.listeners: List[Callable[[Snapshot, Snapshot], None]] = []
+        self._reload_requested = False
+        self._checked_at = 0.0
+        self._pointer_mtime: Optional[float] = self._stat_pointer()
+        self._lock = threading.Lock()
+        try:
+            self._snapshot = self._build(self._read_pointer(), previous=None)
+        except (OSError, ValueError) as e:
+            # A broken published version must not stop workers from starting
+            logger.error('Content version %s failed to load, using built-in data: %s', self._read_pointer(), e)
+            self._snapshot = self._build(BUILTIN_VERSION, previous=None)
+
+    def _stat_pointer(self) -> Optional[float]:
+        try:
+            return os.stat(self.pointer_path).st_mtime
+        except OSError:
+            return None
+
+    def _read_pointer(self) -> str:
+        try:
+            with open(self.pointer_path) as f:
+                return f.read().strip() or BUILTIN_VERSION
+        except OSError:
+            return BUILTIN_VERSION
+
+    def _load_file(self, version: str, name: str) -> Any:
+        if version == BUILTIN_VERSION:
+            return self.builtin[name]
+        path = os.path.join(self.directory, version, f'{name}.json')
+        if not os.path.exists(path):
+            return self.builtin[name]
+        with open(path) as f:
+            return json.load(f)
+
+    def _build(self, version: str, previous: Optional[Snapshot]) -> Snapshot:
+        """Load, validate and compile every file; raises ValueError/OSError on bad content"""
+        if version != BUILTIN_VERSION and not os.path.isdir(os.path.join(self.directory, version)):
+            raise ValueError(f'Unknown content version: {version}')
+        taxonomy = self._load_file(version, 'taxonomy')
+        templates = self._load_file(version, 'templates')
+        articles = self._load_file(version, 'articles')
+        _validate(taxonomy, templates, articles)
+
+        scanner = ATSScanner(
+            recommender=previous.scanner.skill_recommender if previous else None,
+            classifier=previous.scanner.industry_classifier if previous else None,
+            industry_keywords=taxonomy.get('industry_keywords'),
+            required_sections=taxonomy.get('required_sections')
+        )
+        digest = content_hash(taxonomy, templates, articles)[:16]
+        taxonomy_digest = content_hash('taxonomy', taxonomy)[:16]
+        return Snapshot(version, digest, taxonomy_digest, scanner, tuple(templates), tuple(articles))
+
+    def current(self) -> Snapshot:
+        """The active snapshot, swapping in a newly published version if there is one"""
+        now = time.monotonic()
+        if self._reload_requested or now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            mtime = self._stat_pointer()
+            if self._reload_requested or mtime != self._pointer_mtime:
+                self._pointer_mtime = mtime
+                self._reload_requested = False
+                try:
+                    self.reload()
+                except (OSError, ValueError) as e:
+                    # Keep serving the snapshot we have
+                    logger.error('Content reload failed, keeping version %s: %s', self._snapshot.version, e)
+        return self._snapshot
+
+    def reload(self, version: Optional[str] = None) -> Snapshot:
+        """Build a snapshot (optionally publishing a new version) and swap it in
+
+        The version is published only after it built successfully, so a bad
+        version never becomes the one other workers and restarts load.
+        """
+        with self._lock:
+            old = self._snapshot
+            new = self._build(version or self._read_pointer(), previous=old)
+            if version is not None:
+                self._publish(version)
+            self._snapshot = new
+        for listener in self.listeners:
+            listener(old, new)
+        return new
+
+    def _publish(self, version: str) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f'{self.pointer_path}.{os.getpid()}'
+        with open(tmp_path, 'w') as f:
+            f.write(version)
+        os.replace(tmp_path, self.pointer_path)
+        self._pointer_mtime = self._stat_pointer()
+
+    def request_reload(self) -> None:
+        """Signal-handler safe: reload on the next call to current()"""
+        self._reload_requested = True
+
+    def versions(self) -> List[str]:
+        try:
+            published = sorted(e.name for e in os.scandir(self.directory) if e.is_dir())
+        except OSError:
+            published = []
+        return [BUILTIN_VERSION] + published
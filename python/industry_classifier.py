@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Industry Classifier
+Linear model over hashed word n-grams, trained offline and loaded once per process
+"""
+
+import argparse
+import json
+import os
+import random
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from scipy.special import expit
+from sklearn.feature_extraction.text import HashingVectorizer
+
+DEFAULT_MODEL_PATH = os.environ.get(
+    'INDUSTRY_MODEL_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'industry_model.npz')
+)
+
+N_FEATURES = 2 ** 18
+NGRAM_RANGE = (1, 2)
+
+# Weights smaller than this are dropped from the artifact
+PRUNE_THRESHOLD = 1e-3
+
+
+def make_vectorizer(n_features: int = N_FEATURES, ngram_range: Tuple[int, int] = NGRAM_RANGE) -> HashingVectorizer:
+    return HashingVectorizer(n_features=n_features, ngram_range=ngram_range,
+                             alternate_sign=False, norm='l2', dtype=np.float32)
+
+
+class IndustryClassifier:
+    def __init__(self, classes: List[str], weights: sparse.csr_matrix, intercept: np.ndarray,
+                 n_features: int = N_FEATURES, ngram_range: Tuple[int, int] = NGRAM_RANGE):
+        self.classes = classes
+        self.weights = weights  # n_features x n_classes
+        self.intercept = intercept
+        self.vectorizer = make_vectorizer(n_features, ngram_range)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_MODEL_PATH) -> 'IndustryClassifier':
+        with np.load(path) as artifact:
+            weights = sparse.csr_matrix(
+                (artifact['data'], artifact['indices'], artifact['indptr']),
+                shape=tuple(artifact['shape'])
+            )
+            return cls(
+                classes=[str(c) for c in artifact['classes']],
+                weights=weights,
+                intercept=artifact['intercept'],
+                n_features=int(artifact['shape'][0]),
+                ngram_range=tuple(int(n) for n in artifact['ngram_range'])
+            )
+
+    @classmethod
+    def load_default(cls) -> Optional['IndustryClassifier']:
+        """The trained model, or None when it has not been trained"""
+        if not os.path.exists(DEFAULT_MODEL_PATH):
+            return None
+        return cls.load(DEFAULT_MODEL_PATH)
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(
+            path,
+            classes=np.array(self.classes),
+            data=self.weights.data,
+            indices=self.weights.indices,
+            indptr=self.weights.indptr,
+            shape=np.array(self.weights.shape),
+            intercept=self.intercept,
+            ngram_range=np.array(self.vectorizer.ngram_range)
+        )
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """Class probabilities for a batch of texts
+
+        The weights are one-vs-rest logistic models, so each class gets its
+        own sigmoid and the row is normalized to sum to 1, as sklearn does
+        for OvR log-loss models. (A softmax over OvR scores is not a
+        probability the confidence threshold could be compared against.)
+        """
+        decision = np.asarray((self.vectorizer.transform(texts) @ self.weights).todense()) + self.intercept
+        if len(self.classes) == 2:
+            # Binary models store one decision column for the second class
+            positive = expit(decision[:, :1])
+            return np.hstack([1 - positive, positive])
+        probabilities = expit(decision)
+        totals = probabilities.sum(axis=1, keepdims=True)
+        # Every sigmoid underflowed: no class is favoured
+        return np.divide(probabilities, totals, out=np.full_like(probabilities, 1 / len(self.classes)),
+                         where=totals > 0)
+
+    def predict(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """(industry, confidence) for each text"""
+        if not texts:
+            return []
+        probabilities = self.predict_proba(texts)
+        best = probabilities.argmax(axis=1)
+        return [(self.classes[i], float(probabilities[row, i])) for row, i in enumerate(best)]
+
+
+def train(examples: List[Dict[str, Any]], holdout: float = 0.1, seed: int = 7) -> Tuple[IndustryClassifier, Dict[str, Any]]:
+    """Fit one-vs-rest logistic regressions (SGD, log loss) on hashed n-grams"""
+    from sklearn.linear_model import SGDClassifier
+
+    random.Random(seed).shuffle(examples)
+    split = int(len(examples) * (1 - holdout))
+    train_set, test_set = examples[:split], examples[split:]
+
+    vectorizer = make_vectorizer()
+    model = SGDClassifier(loss='log_loss', alpha=1e-5, max_iter=30, tol=1e-4, random_state=seed)
+    model.fit(vectorizer.transform([e['text'] for e in train_set]), [e['industry'] for e in train_set])
+
+    coef = model.coef_.T.astype(np.float32)
+    coef[np.abs(coef) < PRUNE_THRESHOLD] = 0
+    classifier = IndustryClassifier(
+        classes=[str(c) for c in model.classes_],
+        weights=sparse.csr_matrix(coef),
+        intercept=model.intercept_.astype(np.float32)
+    )
+
+    metrics: Dict[str, Any] = {'train': len(train_set), 'test': len(test_set),
+                               'classes': len(classifier.classes), 'weights': int(classifier.weights.nnz)}
+    if test_set:
+        predictions = classifier.predict([e['text'] for e in test_set])
+        correct = sum(label == e['industry'] for (label, _), e in zip(predictions, test_set))
+        metrics['accuracy'] = correct / len(test_set)
+    return classifier, metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the industry classifier')
+    parser.add_argument('corpus', help='.jsonl file with "text" and "industry" fields')
+    parser.add_argument('--out', default=DEFAULT_MODEL_PATH)
+    args = parser.parse_args()
+
+    with open(args.corpus, encoding='utf-8') as f:
+        examples = [json.loads(line) for line in f if line.strip()]
+
+    classifier, metrics = train(examples)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    classifier.save(args.out)
+    print(json.dumps(metrics))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Job Profiles
+Job postings compiled once into weighted keyword matchers and reused across every scan against them
+"""
+
+import json
+import math
+import os
+import time
+from typing import Dict, List, Any, Optional
+
+from ats_scanner import ATSScanner
+from memory_budget import BoundedStore, MB
+from single_flight import content_hash
+from text_normalizer import PhraseMatcher, normalize_text
+
+JOB_PROFILE_DIR = os.environ.get('JOB_PROFILE_DIR', '/tmp/resumesmartbuild_job_profiles')
+
+JOB_PROFILES_MEMORY_BUDGET = int(os.environ.get('JOB_PROFILES_MEMORY_MB', 16)) * MB
+
+
+class JobProfile:
+    """Compiled posting: keywords with weights, their matcher, required sections and industry"""
+
+    __slots__ = ('id', 'title', 'weights', 'keywords', 'matcher', 'required_sections',
+                 'industry', 'industry_confidence', 'content_version', 'created_at')
+
+    def __init__(self, profile_id: str, title: str, weights: Dict[str, float], required_sections: List[str],
+                 industry: str, industry_confidence: Optional[float], content_version: str,
+                 created_at: Optional[float] = None):
+        self.id = profile_id
+        self.title = title
+        self.weights = weights
+        # Heaviest first, so missing keywords come out in order of importance
+        self.keywords = sorted(weights, key=weights.get, reverse=True)
+        self.matcher = PhraseMatcher(self.keywords)
+        self.required_sections = required_sections
+        self.industry = industry
+        self.industry_confidence = industry_confidence
+        self.content_version = content_version
+        self.created_at = created_at or time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'title': self.title,
+            'keywords': [{'keyword': k, 'weight': self.weights[k]} for k in self.keywords],
+            'requiredSections': self.required_sections,
+            'industry': self.industry,
+            'industryConfidence': self.industry_confidence,
+            'contentVersion': self.content_version,
+            'createdAt': self.created_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'JobProfile':
+        return cls(
+            data['id'], data['title'], {k['keyword']: k['weight'] for k in data['keywords']},
+            data['requiredSections'], data['industry'], data['industryConfidence'],
+            data['contentVersion'], data['createdAt']
+        )
+
+
+def _validate_overrides(required_sections: Any, keywords: Any) -> None:
+    """Raise ValueError unless sections are strings and keyword weights are positive and finite"""
+    if required_sections is not None and (
+            not isinstance(required_sections, list)
+            or not all(isinstance(s, str) and s for s in required_sections)):
+        raise ValueError('requiredSections must be a list of section names')
+    if keywords is None:
+        return
+    if isinstance(keywords, dict):
+        terms, weights = list(keywords), list(keywords.values())
+    elif isinstance(keywords, list):
+        terms, weights = keywords, []
+    else:
+        raise ValueError('keywords must be a list of keywords or a {keyword: weight} object')
+    if not all(isinstance(k, str) and k.strip() for k in terms):
+        raise ValueError('keywords must be non-empty strings')
+    for weight in weights:
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) \
+                or not math.isfinite(weight) or weight <= 0:
+            raise ValueError('Keyword weights must be positive numbers')
+
+
+def compile_profile(scanner: ATSScanner, description: str, title: str = '',
+                    required_sections: Optional[List[str]] = None,
+                    keywords: Any = None, content_version: str = '',
+                    taxonomy_digest: str = '') -> JobProfile:
+    """Extract and weight the posting's keywords and detect its industry, once
+
+    Taxonomy keywords are weighted by how often the posting mentions them
+    (1 + ln count). `keywords` adds or overrides terms: a list (weight 1) or
+    a {keyword: weight} dict; invalid overrides raise ValueError. The id
+    covers the taxonomy the scanner was built from, so recompiling after a
+    taxonomy change yields a new profile (template or article edits do not).
+    """
+    _validate_overrides(required_sections, keywords)
+    profile_id = content_hash('job_profile', description, title, required_sections, keywords,
+                              taxonomy_digest)[:16]
+    tokens = normalize_text(description)
+    counts = scanner.keyword_matcher.counts(tokens)
+    industry, confidence = scanner.detect_industries([description.lower()], [set(counts)])[0]
+
+    weights = {
+        keyword: round(1 + math.log(counts[keyword]), 3)
+        for keyword in scanner.all_keywords if keyword in counts
+    }
+    if not weights and not keywords:
+        # Nothing from the taxonomy in the posting: fall back to the industry's terms
+        fallback = scanner.industry_keywords.get(industry, []) + scanner.industry_keywords['general']
+        weights = dict.fromkeys(fallback, 1.0)
+    if isinstance(keywords, dict):
+        weights.update({k: float(w) for k, w in keywords.items()})
+    elif keywords:
+        weights.update(dict.fromkeys(keywords, 1.0))
+
+    return JobProfile(profile_id, title, weights, list(required_sections or scanner.required_sections),
+                      industry, confidence, content_version)
+
+
+class JobProfileStore:
+    """Profiles kept in an LRU byte-budgeted cache and persisted as JSON files
+
+    Files are shared by every worker and the background job processes; a
+    profile evicted from memory (or compiled by another process) is read back
+    from disk on the next lookup.
+    """
+
+    def __init__(self, directory: str = JOB_PROFILE_DIR, max_bytes: int = JOB_PROFILES_MEMORY_BUDGET):
+        self.directory = directory
+        self.cache = BoundedStore('job_profiles', max_bytes)
+
+    def _path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f'{profile_id}.json')
+
+    def put(self, profile: JobProfile) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f'{self._path(profile.id)}.{os.getpid()}'
+        with open(tmp_path, 'w') as f:
+            json.dump(profile.to_dict(), f)
+        os.replace(tmp_path, self._path(profile.id))
+        self.cache[profile.id] = profile
+
+    def get(self, profile_id: Any) -> Optional[JobProfile]:
+        # Ids come straight from request JSON and double as file names
+        if not isinstance(profile_id, str) or not profile_id.isalnum():
+            return None
+        profile = self.cache.get(profile_id)
+        if profile is not None:
+            return profile
+        try:
+            with open(self._path(profile_id)) as f:
+                profile = JobProfile.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+        self.cache[profile_id] = profile
+        return profile
+
+
+# Shared by the web routes and the background job handlers of a process
+job_profiles = JobProfileStore()
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Background Job Queue
+SQLite-backed durable queue and worker processes for long-running ATS scans
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Callable
+
+from ats_scanner import ATSScanner
+from content_snapshots import SnapshotStore
+from job_profiles import JobProfile, job_profiles
+from single_flight import SingleFlight, content_hash
+from resume_dedup import DEFAULT_SIMILARITY_THRESHOLD, scan_deduplicated
+
+# Priority lanes: lower value is claimed first
+PRIORITY_LANES = {
+    'interactive': 0,
+    'default': 5,
+    'batch': 10
+}
+
+DEFAULT_DB_PATH = os.environ.get('JOB_QUEUE_DB', '/tmp/resumesmartbuild_jobs.db')
+
+# Accepted per-job maxAttempts (inclusive)
+MAX_ATTEMPTS_RANGE = (1, 10)
+
+# Seconds a supervisor waits between checks for exited worker processes
+SUPERVISOR_INTERVAL = 1.0
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    run_after REAL NOT NULL,
+    lease_expires REAL,
+    worker_id TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_claim_idx ON jobs (status, priority, run_after);
+"""
+
+
+class JobQueue:
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, max_attempts: int = 3,
+                 backoff_base: float = 2.0, lease_seconds: float = 300):
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.lease_seconds = lease_seconds
+        self._schema_ready = False
+
+    @contextmanager
+    def _connect(self):
+        """Open a short-lived connection (connections must not cross a fork)"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            if not self._schema_ready:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.executescript(SCHEMA)
+                self._schema_ready = True
+            yield conn
+        finally:
+            conn.close()
+
+    def _to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            'id': row['id'],
+            'type': row['kind'],
+            'priority': row['lane'],
+            'status': row['status'],
+            'attempts': row['attempts'],
+            'maxAttempts': row['max_attempts'],
+            'cancelRequested': bool(row['cancel_requested']),
+            'result': json.loads(row['result']) if row['result'] else None,
+            'error': row['error'],
+            'runAfter': row['run_after'],
+            'createdAt': row['created_at'],
+            'updatedAt': row['updated_at']
+        }
+
+    def submit(self, kind: str, payload: Dict[str, Any], lane: str = 'default',
+               max_attempts: Optional[int] = None) -> Dict[str, Any]:
+        """Add a job to the queue"""
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f'Unknown job type: {kind}')
+        if lane not in PRIORITY_LANES:
+            raise ValueError(f'Unknown priority lane: {lane}')
+        if max_attempts is None:
+            max_attempts = self.max_attempts
+        low, high = MAX_ATTEMPTS_RANGE
+        if isinstance(max_attempts, bool) or not isinstance(max_attempts, int) or not low <= max_attempts <= high:
+            raise ValueError(f'maxAttempts must be an integer from {low} to {high}')
+
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO jobs (id, kind, lane, priority, status, payload, max_attempts, '
+                'run_after, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (job_id, kind, lane, PRIORITY_LANES[lane], 'queued', json.dumps(payload),
+                 max_attempts, now, now, now)
+            )
+            row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return self._to_dict(row)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return job status and result, or None if unknown"""
+        with self._connect() as conn:
+            row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Cancel a queued job, or flag a running job so its result is discarded"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            if not row:
+                conn.execute('COMMIT')
+                return None
+            if row['status'] == 'queued':
+                conn.execute(
+                    "UPDATE jobs SET status = 'cancelled', cancel_requested = 1, updated_at = ? "
+                    'WHERE id = ?', (now, job_id)
+                )
+            elif row['status'] == 'running':
+                conn.execute(
+                    'UPDATE jobs SET cancel_requested = 1, updated_at = ? WHERE id = ?',
+                    (now, job_id)
+                )
+            row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            conn.execute('COMMIT')
+        return self._to_dict(row)
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Lease the highest-priority runnable job (expired leases are reclaimed)
+
+        A job whose lease expired on its last allowed attempt (e.g. it keeps
+        killing its worker) is marked failed instead of being reclaimed.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            while True:
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE (status = 'queued' AND run_after <= ?) "
+                    "OR (status = 'running' AND lease_expires < ?) "
+                    'ORDER BY priority, run_after LIMIT 1', (now, now)
+                ).fetchone()
+                if not row:
+                    conn.execute('COMMIT')
+                    return None
+                if row['status'] == 'queued' or row['attempts'] < row['max_attempts']:
+                    break
+                conn.execute(
+                    "UPDATE jobs SET status = CASE WHEN cancel_requested THEN 'cancelled' ELSE 'failed' END, "
+                    'error = ?, lease_expires = NULL, worker_id = NULL, updated_at = ? WHERE id = ?',
+                    (f"Lease expired on attempt {row['attempts']} of {row['max_attempts']}", now, row['id'])
+                )
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker_id = ?, "
+                'lease_expires = ?, updated_at = ? WHERE id = ?',
+                (worker_id, now + self.lease_seconds, now, row['id'])
+            )
+            conn.execute('COMMIT')
+
+        job = self._to_dict(row)
+        job['attempts'] += 1
+        job['payload'] = json.loads(row['payload'])
+        return job
+
+    def complete(self, job_id: str, worker_id: str, result: Any) -> bool:
+        """Store a job result (discarded if cancellation was requested meanwhile)
+
+        Only the current leaseholder may complete a job; returns False when the
+        lease was lost to another worker.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = CASE WHEN cancel_requested THEN 'cancelled' "
+                "ELSE 'succeeded' END, result = CASE WHEN cancel_requested THEN NULL ELSE ? END, "
+                "lease_expires = NULL, updated_at = ? WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (json.dumps(result), now, job_id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Record a failure and schedule a retry with exponential backoff
+
+        Ignored (returns False) unless worker_id still holds the job's lease.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (job_id, worker_id)
+            ).fetchone()
+            if not row:
+                conn.execute('COMMIT')
+                return False
+            if row['cancel_requested']:
+                status, run_after = 'cancelled', row['run_after']
+            elif row['attempts'] < row['max_attempts']:
+                status, run_after = 'queued', now + self.backoff_base ** row['attempts']
+            else:
+                status, run_after = 'failed', row['run_after']
+            conn.execute(
+                'UPDATE jobs SET status = ?, error = ?, run_after = ?, lease_expires = NULL, '
+                'updated_at = ? WHERE id = ?', (status, error, run_after, now, job_id)
+            )
+            conn.execute('COMMIT')
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Count jobs per lane and status"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT lane, status, COUNT(*) AS n FROM jobs GROUP BY lane, status'
+            ).fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            counts.setdefault(row['lane'], {})[row['status']] = row['n']
+        return counts
+
+
+# Shares in-flight scans with web workers and other job workers on this host
+scan_flight = SingleFlight()
+
+
+def _job_profile(profile_id: str) -> JobProfile:
+    profile = job_profiles.get(profile_id)
+    if profile is None:
+        raise ValueError(f'Unknown job profile: {profile_id}')
+    return profile
+
+
+def _run_scan(scanner: ATSScanner, payload: Dict[str, Any]) -> Dict[str, Any]:
+    content = payload['content']
+    if isinstance(content, str):
+        content = json.loads(content)
+    job_position = payload.get('jobPosition', 'general')
+    job_description = payload.get('jobDescription') or None
+    if payload.get('jobProfileId'):
+        profile = _job_profile(payload['jobProfileId'])
+        key = content_hash('scan_profile', payload['taxonomyDigest'], content, profile.id)
+        return scan_flight.do(key, lambda: scanner.scan_profile(content, profile))
+    key = content_hash('scan', payload['taxonomyDigest'], content, job_position, job_description)
+    return scan_flight.do(key, lambda: scanner.scan(content, job_position, job_description))
+
+
+def _run_scan_many(scanner: ATSScanner, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    content = payload['content']
+    if isinstance(content, str):
+        content = json.loads(content)
+    return scanner.scan_many(content, payload['jobs'])
+
+
+def _run_scan_batch(scanner: ATSScanner, payload: Dict[str, Any]) -> Dict[str, Any]:
+    resumes = [
+        dict(resume, content=json.loads(resume['content']) if isinstance(resume['content'], str) else resume['content'])
+        for resume in payload['resumes']
+    ]
+    threshold = payload.get('similarityThreshold', DEFAULT_SIMILARITY_THRESHOLD)
+    scan = None
+    if payload.get('jobProfileId'):
+        profile = _job_profile(payload['jobProfileId'])
+
+        def scan(content, job_position):
+            return scanner.scan_profile(content, profile)
+    return scan_deduplicated(scanner, resumes, payload.get('jobPosition', 'general'), threshold, scan=scan)
+
+
+# Job type -> handler(scanner, payload)
+JOB_HANDLERS: Dict[str, Callable[[ATSScanner, Dict[str, Any]], Any]] = {
+    'scan': _run_scan,
+    'scan_many': _run_scan_many,
+    'scan_batch': _run_scan_batch
+}
+
+
+def run_worker(db_path: str = DEFAULT_DB_PATH, poll_interval: float = 0.5) -> None:
+    """Claim and execute jobs until SIGTERM/SIGINT"""
+    queue = JobQueue(db_path)
+    # Workers only need the taxonomy; templates and articles stay with the web app
+    snapshots = SnapshotStore({'taxonomy': {}, 'templates': [], 'articles': []})
+    worker_id = f'{os.uname().nodename}:{os.getpid()}'
+    running = True
+
+    def stop(signum, frame):
+        nonlocal running
+        running = False
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while running:
+        try:
+            job = queue.claim(worker_id)
+        except Exception:
+            # A locked database or a bad row must not take the worker down
+            logger.exception('Claiming a job failed')
+            time.sleep(poll_interval)
+            continue
+        if not job:
+            time.sleep(poll_interval)
+            continue
+        try:
+            snapshot = snapshots.current()
+            job['payload']['taxonomyDigest'] = snapshot.taxonomy_digest
+            result = JOB_HANDLERS[job['type']](snapshot.scanner, job['payload'])
+        except Exception as e:
+            error, result = str(e), None
+        else:
+            error = None
+        try:
+            if error is None:
+                queue.complete(job['id'], worker_id, result)
+            else:
+                queue.fail(job['id'], worker_id, error)
+        except Exception:
+            # The lease expires and the job is reclaimed (or failed) later
+            logger.exception('Recording the outcome of job %s failed', job['id'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run background ATS scan workers')
+    parser.add_argument('--workers', type=int,
+                        default=int(os.environ.get('JOB_WORKERS', 2)))
+    parser.add_argument('--db', default=DEFAULT_DB_PATH)
+    args = parser.parse_args()
+
+    def start_worker() -> multiprocessing.Process:
+        process = multiprocessing.Process(target=run_worker, args=(args.db,))
+        process.start()
+        return process
+
+    processes: List[multiprocessing.Process] = [start_worker() for _ in range(args.workers)]
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for process in processes:
+            process.terminate()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    # Replace workers that exit unexpectedly until asked to stop
+    while not stopping:
+        for index, process in enumerate(processes):
+            if not process.is_alive() and not stopping:
+                logger.warning('Worker %s exited with code %s; restarting', process.pid, process.exitcode)
+                processes[index] = start_worker()
+        time.sleep(SUPERVISOR_INTERVAL)
+
+    for process in processes:
+        process.join()
+
+
+if __name__ == '__main__':
+    main()
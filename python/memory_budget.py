@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Memory Governance
+Byte-budgeted in-process stores, compact scan records and tracemalloc reporting
+"""
+
+import gc
+import os
+import sys
+import threading
+import tracemalloc
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Dict, List, Any, Iterator, Optional
+
+MB = 1024 * 1024
+
+# Every BoundedStore created in this process, by name
+STORES: Dict[str, 'BoundedStore'] = {}
+
+
+def approx_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """Deep size estimate of containers, strings and __slots__ objects"""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        size += sum(approx_size(k, _seen) + approx_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approx_size(item, _seen) for item in obj)
+    elif hasattr(obj, '__slots__'):
+        size += sum(approx_size(getattr(obj, slot), _seen)
+                    for slot in obj.__slots__ if hasattr(obj, slot))
+    elif hasattr(obj, '__dict__'):
+        size += approx_size(vars(obj), _seen)
+    return size
+
+
+class BoundedStore(MutableMapping):
+    """Dict with a byte budget; least recently used entries are evicted first
+
+    Safe to share between request threads.
+    """
+
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.evictions = 0
+        self._data: 'OrderedDict[Any, Any]' = OrderedDict()
+        self._sizes: Dict[Any, int] = {}
+        self._lock = threading.RLock()
+        STORES[name] = self
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        size = approx_size(key) + approx_size(value)
+        with self._lock:
+            if key in self._data:
+                del self[key]
+            self._data[key] = value
+            self._sizes[key] = size
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes and len(self._data) > 1:
+                oldest = next(iter(self._data))
+                del self[oldest]
+                self.evictions += 1
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+            self.current_bytes -= self._sizes.pop(key)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'entries': len(self._data),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'evictions': self.evictions
+        }
+
+
+class ScanRecord:
+    """Compact cached scan result (a fraction of the nested-dict footprint)"""
+
+    __slots__ = (
+        'score', 'industry', 'industry_confidence', 'keyword_score', 'found', 'missing',
+        'total_possible', 'structure_score', 'present_sections', 'missing_sections',
+        'readability_score', 'readability_level', 'flesch_score', 'suggestions'
+    )
+
+    def __init__(self, result: Dict[str, Any]):
+        keywords = result['keywords']
+        structure = result['structure']
+        readability = result['readability']
+        self.score = result['score']
+        self.industry = sys.intern(result['industry'])
+        self.industry_confidence = result.get('industry_confidence')
+        self.keyword_score = keywords['score']
+        self.found = tuple(sys.intern(k) for k in keywords['found'])
+        self.missing = tuple(sys.intern(k) for k in keywords['missing'])
+        self.total_possible = keywords['total_possible']
+        self.structure_score = structure['score']
+        self.present_sections = tuple(sys.intern(s) for s in structure['present'])
+        self.missing_sections = tuple(sys.intern(s) for s in structure['missing'])
+        self.readability_score = readability['score']
+        self.readability_level = sys.intern(readability['level'])
+        self.flesch_score = readability.get('flesch_score')
+        self.suggestions = tuple(result['suggestions'])
+
+    def to_dict(self) -> Dict[str, Any]:
+        readability = {'score': self.readability_score, 'level': self.readability_level}
+        if self.flesch_score is not None:
+            readability['flesch_score'] = self.flesch_score
+        return {
+            'score': self.score,
+            'industry': self.industry,
+            'industry_confidence': self.industry_confidence,
+            'keywords': {
+                'score': self.keyword_score,
+                'found': list(self.found),
+                'missing': list(self.missing),
+                'total_possible': self.total_possible
+            },
+            'structure': {
+                'score': self.structure_score,
+                'present': list(self.present_sections),
+                'missing': list(self.missing_sections)
+            },
+            'readability': readability,
+            'suggestions': list(self.suggestions)
+        }
+
+
+def process_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (Linux only)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def process_memory(pid: Any = 'self') -> Optional[Dict[str, int]]:
+    """Shared vs private (unique) bytes of a process from /proc/<pid>/smaps_rollup (Linux only)
+
+    Pages still shared with the preloaded master count as shared; pss splits
+    each shared page evenly between the processes mapping it.
+    """
+    fields: Dict[str, int] = {}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == 'kB':
+                    fields[parts[0].rstrip(':')] = int(parts[1]) * 1024
+    except OSError:
+        return None
+    return {
+        'rss_bytes': fields.get('Rss', 0),
+        'pss_bytes': fields.get('Pss', 0),
+        'shared_bytes': fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0),
+        'private_bytes': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+    }
+
+
+def sibling_pids() -> List[int]:
+    """Other children of our parent running the same command (the other gunicorn workers)"""
+    parent = os.getppid()
+    try:
+        with open('/proc/self/cmdline', 'rb') as f:
+            cmdline = f.read()
+        entries = os.listdir('/proc')
+    except OSError:
+        return []
+    pids = []
+    for entry in entries:
+        if not entry.isdigit() or int(entry) == os.getpid():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # Fields after the parenthesised command name: state, ppid, ...
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            if ppid != parent:
+                continue
+            with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                if f.read() == cmdline:
+                    pids.append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+    return sorted(pids)
+
+
+def memory_report(limit: int = 20) -> Dict[str, Any]:
+    """Store budgets plus the top tracemalloc allocation sites"""
+    report: Dict[str, Any] = {
+        'pid': os.getpid(),
+        'rss_bytes': process_rss(),
+        'memory': process_memory(),
+        'workers': [dict(process_memory(pid) or {}, pid=pid) for pid in sibling_pids()],
+        'gc_frozen_objects': gc.get_freeze_count(),
+        'stores': {name: store.stats() for name, store in STORES.items()},
+        'tracemalloc': tracemalloc.is_tracing()
+    }
+    if tracemalloc.is_tracing():
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        top: List[Dict[str, Any]] = []
+        for stat in snapshot.statistics('lineno')[:limit]:
+            frame = stat.traceback[0]
+            top.append({
+                'location': f'{frame.filename}:{frame.lineno}',
+                'size_bytes': stat.size,
+                'count': stat.count
+            })
+        report['traced_bytes'] = current
+        report['traced_peak_bytes'] = peak
+        report['top_allocators'] = top
+    return report
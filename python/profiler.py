@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+On-Demand Profiler
+Low-overhead stack sampling shared across gunicorn workers, plus per-request cProfile summaries
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List, Any, Optional
+
+PROFILE_DIR = os.environ.get('PROFILE_DIR', '/tmp/resumesmartbuild_profiles')
+
+# How often workers re-read the active session file (seconds)
+SESSION_CHECK_INTERVAL = 1.0
+
+# Accepted ranges for session parameters
+MAX_SESSION_SECONDS = 3600
+MAX_SESSION_REQUESTS = 100000
+INTERVAL_MS_RANGE = (1, 1000)
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+def _collapse(frame) -> str:
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class ProfileSession:
+    """A profiling window written to disk so every worker on the box sees it"""
+
+    def __init__(self, directory: str = PROFILE_DIR):
+        self.directory = directory
+        self.active_path = os.path.join(directory, 'active.json')
+
+    def start(self, route: str, seconds: float = 30, max_requests: Optional[int] = None,
+              interval_ms: float = 5) -> Dict[str, Any]:
+        """Open a session, replacing any active one; raises ValueError on out-of-range parameters"""
+        seconds = float(seconds)
+        interval_ms = float(interval_ms)
+        max_requests = int(max_requests) if max_requests is not None else None
+        if not isinstance(route, str) or not route.startswith('/'):
+            raise ValueError('route must be a path starting with /')
+        if not 0 < seconds <= MAX_SESSION_SECONDS:
+            raise ValueError(f'seconds must be between 0 and {MAX_SESSION_SECONDS}')
+        if max_requests is not None and not 0 < max_requests <= MAX_SESSION_REQUESTS:
+            raise ValueError(f'requests must be between 1 and {MAX_SESSION_REQUESTS}')
+        if not INTERVAL_MS_RANGE[0] <= interval_ms <= INTERVAL_MS_RANGE[1]:
+            raise ValueError(f'intervalMs must be between {INTERVAL_MS_RANGE[0]} and {INTERVAL_MS_RANGE[1]}')
+        session = {
+            'id': uuid.uuid4().hex[:12],
+            'route': route,
+            'started_at': time.time(),
+            'until': time.time() + seconds,
+            'max_requests': max_requests,
+            'interval_ms': interval_ms
+        }
+        os.makedirs(os.path.join(self.directory, session['id']), exist_ok=True)
+        tmp_path = f'{self.active_path}.{os.getpid()}'
+        with open(tmp_path, 'w') as f:
+            json.dump(session, f)
+        os.replace(tmp_path, self.active_path)
+        return session
+
+    def active(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.active_path) as f:
+                session = json.load(f)
+            return session if self.is_open(session) else None
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or malformed session file: nothing is being profiled
+            return None
+
+    def stop(self, session_id: str) -> bool:
+        """End a session early; its collected stacks stay readable"""
+        session = self.active()
+        if not session or session['id'] != session_id:
+            return False
+        try:
+            os.remove(self.active_path)
+        except OSError:
+            return False
+        return True
+
+    def is_open(self, session: Dict[str, Any]) -> bool:
+        """Whether the session still has time and request budget left"""
+        if time.time() > session['until']:
+            return False
+        if session['max_requests'] and self.request_count(session['id']) >= session['max_requests']:
+            return False
+        return True
+
+    def record_request(self, session_id: str) -> None:
+        # One byte per profiled request; O_APPEND keeps concurrent workers consistent
+        fd = os.open(os.path.join(self.directory, session_id, 'requests'),
+                     os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+        try:
+            os.write(fd, b'.')
+        finally:
+            os.close(fd)
+
+    def request_count(self, session_id: str) -> int:
+        try:
+            return os.path.getsize(os.path.join(self.directory, session_id, 'requests'))
+        except OSError:
+            return 0
+
+    def write_stacks(self, session_id: str, stacks: Counter) -> None:
+        path = os.path.join(self.directory, session_id, f'{os.getpid()}.collapsed')
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            for stack, count in stacks.items():
+                f.write(f'{stack} {count}\n')
+        os.replace(tmp_path, path)
+
+    def collect(self, session_id: str) -> Optional[Counter]:
+        """Merge the stacks written by every worker"""
+        session_dir = os.path.join(self.directory, session_id)
+        if not session_id.isalnum() or not os.path.isdir(session_dir):
+            return None
+        stacks: Counter = Counter()
+        for name in os.listdir(session_dir):
+            if not name.endswith('.collapsed'):
+                continue
+            with open(os.path.join(session_dir, name)) as f:
+                for line in f:
+                    stack, _, count = line.rstrip('\n').rpartition(' ')
+                    stacks[stack] += int(count)
+        return stacks
+
+
+class StackSampler:
+    """Background thread sampling the stacks of registered request threads"""
+
+    def __init__(self):
+        self.stacks: Counter = Counter()
+        self.session_id: Optional[str] = None
+        self.interval = 0.005
+        self._targets: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def begin(self, session: Dict[str, Any]) -> None:
+        """Start sampling the calling thread for a session"""
+        with self._lock:
+            if session['id'] != self.session_id:
+                self.session_id = session['id']
+                self.stacks = Counter()
+            self.interval = session['interval_ms'] / 1000
+            thread_id = threading.get_ident()
+            self._targets[thread_id] = self._targets.get(thread_id, 0) + 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+                self._thread.start()
+
+    def end(self) -> Counter:
+        """Stop sampling the calling thread and return this worker's stacks"""
+        with self._lock:
+            thread_id = threading.get_ident()
+            if self._targets.get(thread_id, 0) <= 1:
+                self._targets.pop(thread_id, None)
+            else:
+                self._targets[thread_id] -= 1
+            return Counter(self.stacks)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                targets = list(self._targets)
+                if not targets:
+                    # Cleared under the lock, so a concurrent begin() starts a new thread
+                    self._thread = None
+                    return
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id in targets:
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        self.stacks[_collapse(frame)] += 1
+            time.sleep(self.interval)
+
+
+def to_collapsed(stacks: Counter) -> str:
+    """Brendan Gregg collapsed-stack format (flamegraph.pl, speedscope, inferno)"""
+    return ''.join(f'{stack} {count}\n' for stack, count in stacks.most_common())
+
+
+def to_speedscope(stacks: Counter, name: str) -> Dict[str, Any]:
+    """speedscope 'sampled' profile document"""
+    frame_index: Dict[str, int] = {}
+    frames: List[Dict[str, str]] = []
+    samples: List[List[int]] = []
+    weights: List[int] = []
+
+    for stack, count in stacks.most_common():
+        sample = []
+        for frame_name in stack.split(';'):
+            if frame_name not in frame_index:
+                frame_index[frame_name] = len(frames)
+                frames.append({'name': frame_name})
+            sample.append(frame_index[frame_name])
+        samples.append(sample)
+        weights.append(count)
+
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'shared': {'frames': frames},
+        'profiles': [{
+            'type': 'sampled',
+            'name': name,
+            'unit': 'none',
+            'startValue': 0,
+            'endValue': sum(weights),
+            'samples': samples,
+            'weights': weights
+        }],
+        'exporter': 'resumesmartbuild'
+    }
+
+
+def cprofile_summary(profile: cProfile.Profile, limit: int = 25) -> Dict[str, Any]:
+    """Top functions by cumulative time for a single request"""
+    stream = io.StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    stats.sort_stats('cumulative').print_stats(limit)
+    return {
+        'total_calls': stats.total_calls,
+        'total_time': stats.total_tt,
+        'report': stream.getvalue()
+    }
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Resume Detection
+MinHash signatures and an LSH index to group near-identical resumes before scanning
+"""
+
+import re
+import zlib
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple
+
+import numpy as np
+
+from ats_scanner import ATSScanner
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.9
+DEFAULT_NUM_PERM = 128
+SHINGLE_SIZE = 5
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_EMPTY_HASHES = np.zeros(1, dtype=np.uint64)
+
+
+def shingle_hashes(text: str, k: int = SHINGLE_SIZE) -> np.ndarray:
+    """Hash every k-word shingle of the text to a 32-bit integer"""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= k:
+        shingles = {' '.join(words)} if words else set()
+    else:
+        shingles = {' '.join(words[i:i + k]) for i in range(len(words) - k + 1)}
+    if not shingles:
+        return _EMPTY_HASHES
+    return np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1):
+        # Multiply-shift hash family: h(x) = ((a * x + b) mod 2^64) >> 32, a odd
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = (rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self.b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        """MinHash signature of a shingle hash set"""
+        permuted = (self.a[:, None] * hashes[None, :] + self.b[:, None]) >> np.uint64(32)
+        return permuted.min(axis=1)
+
+
+def optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Pick (bands, rows) whose LSH S-curve crosses the threshold closest"""
+    best = (num_perm, 1)
+    best_error = float('inf')
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class LSHIndex:
+    def __init__(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM):
+        self.threshold = threshold
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        self.buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self.signatures: List[np.ndarray] = []
+
+    def add(self, signature: np.ndarray) -> List[int]:
+        """Insert a signature and return earlier entries sharing any band bucket"""
+        key = len(self.signatures)
+        self.signatures.append(signature)
+        candidates = set()
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            bucket = self.buckets[band].setdefault(chunk, [])
+            candidates.update(bucket)
+            bucket.append(key)
+        return sorted(candidates)
+
+    def similarity(self, first: int, second: int) -> float:
+        """Estimated Jaccard similarity of two indexed entries"""
+        return float(np.mean(self.signatures[first] == self.signatures[second]))
+
+
+def group_near_duplicates(texts: Iterable[str], threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                          num_perm: int = DEFAULT_NUM_PERM) -> List[List[int]]:
+    """Group text indexes whose estimated similarity is at least the threshold"""
+    hasher = MinHasher(num_perm)
+    index = LSHIndex(threshold, num_perm)
+    parent: List[int] = []
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for text in texts:
+        key = len(parent)
+        parent.append(key)
+        for candidate in index.add(hasher.signature(shingle_hashes(text))):
+            if index.similarity(key, candidate) >= threshold:
+                root, other = find(candidate), find(key)
+                parent[max(root, other)] = min(root, other)
+
+    groups: Dict[int, List[int]] = {}
+    for key in range(len(parent)):
+        groups.setdefault(find(key), []).append(key)
+    return list(groups.values())
+
+
+def scan_deduplicated(scanner: ATSScanner, resumes: List[Dict[str, Any]], job_position: str = 'general',
+                      threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                      scan: Optional[Callable[[Dict[str, Any], str], Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Scan one representative per near-duplicate group and share its result
+
+    Each resume is a dict with 'content' (and an optional 'id'). `scan` defaults
+    to scanner.scan and may be replaced by a caching wrapper.
+    """
+    scan = scan or scanner.scan
+    texts = [scanner.extract_text(resume['content']) for resume in resumes]
+    groups = group_near_duplicates(texts, threshold)
+    ids = [resume.get('id', str(i)) for i, resume in enumerate(resumes)]
+
+    results: List[Dict[str, Any]] = [None] * len(resumes)
+    group_report = []
+    for group_number, members in enumerate(groups):
+        representative = members[0]
+        result = scan(resumes[representative]['content'], job_position)
+        for member in members:
+            results[member] = {
+                'id': ids[member],
+                'group': group_number,
+                'duplicateOf': ids[representative] if member != representative else None,
+                'result': result
+            }
+        group_report.append({
+            'group': group_number,
+            'representative': ids[representative],
+            'members': [ids[m] for m in members]
+        })
+
+    return {
+        'results': results,
+        'groups': group_report,
+        'total_resumes': len(resumes),
+        'scans_performed': len(groups),
+        'threshold': threshold
+    }
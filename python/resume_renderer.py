@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Resume Rendering Engine
+Compiles template layouts into reusable render plans and renders resumes to HTML, PDF and SVG previews
+"""
+
+import hashlib
+import html
+import io
+import json
+import multiprocessing
+import os
+import re
+import textwrap
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from memory_budget import BoundedStore, MB
+
+# Section order and header style per layout name
+LAYOUTS = {
+    'modern': {
+        'sections': ['summary', 'skills', 'experience', 'education'],
+        'header': 'banner',
+        'font': "'Inter', Arial, sans-serif"
+    },
+    'professional': {
+        'sections': ['summary', 'experience', 'education', 'skills'],
+        'header': 'rule',
+        'font': 'Georgia, serif'
+    },
+    'executive': {
+        'sections': ['summary', 'experience', 'skills', 'education'],
+        'header': 'centered',
+        'font': "'Garamond', Georgia, serif"
+    }
+}
+DEFAULT_LAYOUT = 'professional'
+
+SECTION_TITLES = {
+    'summary': 'Professional Summary',
+    'experience': 'Experience',
+    'education': 'Education',
+    'skills': 'Skills'
+}
+
+FRAGMENT_CACHE_MEMORY_BUDGET = int(os.environ.get('RENDER_CACHE_MEMORY_MB', 32)) * MB
+PLAN_CACHE_MEMORY_BUDGET = int(os.environ.get('RENDER_PLANS_MEMORY_MB', 4)) * MB
+EXPORT_PROCESSES = int(os.environ.get('RENDER_PROCESSES', 2))
+
+# Characters replaced in zip member names built from resume ids
+ARCHIVE_NAME_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+# Rendered section HTML keyed by (plan key, section, section content hash)
+fragment_cache = BoundedStore('render_fragments', FRAGMENT_CACHE_MEMORY_BUDGET)
+
+# Compiled plans and preview SVGs keyed by plan key; each content reload adds keys, so both are bounded
+_plans = BoundedStore('render_plans', PLAN_CACHE_MEMORY_BUDGET)
+_previews = BoundedStore('render_previews', PLAN_CACHE_MEMORY_BUDGET)
+_export_pool: Optional[ProcessPoolExecutor] = None
+_export_pool_lock = threading.Lock()
+
+# Forking a multi-threaded gthread worker can copy locks held by other
+# threads into the child; start export processes from a clean interpreter
+EXPORT_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def _hash(value: Any) -> str:
+    return hashlib.sha1(json.dumps(value, sort_keys=True).encode()).hexdigest()
+
+
+def _hex_to_rgb(color: str) -> Tuple[float, float, float]:
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) / 255 for i in (0, 2, 4))
+
+
+class RenderPlan:
+    """Everything about a template that does not depend on resume content"""
+
+    __slots__ = ('key', 'template_id', 'layout', 'sections', 'primary', 'secondary',
+                 'head', 'tail', 'section_heads')
+
+    def __init__(self, template: Dict[str, Any]):
+        data = template.get('templateData', {})
+        colors = data.get('colors') or ['#1f2937', '#374151']
+        layout_name = data.get('layout', DEFAULT_LAYOUT)
+        layout = LAYOUTS.get(layout_name, LAYOUTS[DEFAULT_LAYOUT])
+
+        self.key = f"{template['id']}:{_hash(data)}"
+        self.template_id = template['id']
+        self.layout = layout_name
+        self.sections = tuple(layout['sections'])
+        self.primary = colors[0]
+        self.secondary = colors[1] if len(colors) > 1 else colors[0]
+
+        header_css = {
+            'banner': f'header{{background:{self.primary};color:#fff;padding:24px}}',
+            'rule': f'header{{border-bottom:3px solid {self.primary};padding-bottom:12px}}',
+            'centered': f'header{{text-align:center;border-bottom:1px solid {self.secondary}}}'
+        }[layout['header']]
+        css = (
+            f"body{{font-family:{layout['font']};color:{self.secondary};max-width:800px;margin:auto}}"
+            f'{header_css}h2{{color:{self.primary};font-size:16px;text-transform:uppercase}}'
+            '.rs-item{margin-bottom:10px}.rs-meta{color:#6b7280}'
+        )
+        self.head = (
+            f'<!DOCTYPE html><html><head><meta charset="utf-8"><style>{css}</style></head>'
+            f'<body class="rs-{html.escape(layout_name)}">'
+        )
+        self.tail = '</body></html>'
+        self.section_heads = {
+            name: f'<section class="rs-{name}"><h2>{SECTION_TITLES[name]}</h2>'
+            for name in self.sections
+        }
+
+
+def compile_template(template: Dict[str, Any]) -> RenderPlan:
+    """Return the cached render plan for a template, compiling it on first use"""
+    key = f"{template['id']}:{_hash(template.get('templateData', {}))}"
+    plan = _plans.get(key)
+    if plan is None:
+        plan = _plans[key] = RenderPlan(template)
+    return plan
+
+
+def _render_header(contact: Any) -> str:
+    if isinstance(contact, dict):
+        name = html.escape(contact.get('name', ''))
+        details = ' | '.join(html.escape(str(contact[k]))
+                             for k in ('email', 'phone', 'location') if contact.get(k))
+    else:
+        name, details = '', html.escape(str(contact or ''))
+    return f'<header><h1>{name}</h1><div class="rs-meta">{details}</div></header>'
+
+
+def _render_section(plan: RenderPlan, name: str, value: Any) -> str:
+    parts = [plan.section_heads[name]]
+    if name == 'summary':
+        parts.append(f'<p>{html.escape(str(value))}</p>')
+    elif name == 'skills':
+        skills = value if isinstance(value, list) else [value]
+        parts.append('<ul>' + ''.join(f'<li>{html.escape(str(s))}</li>' for s in skills) + '</ul>')
+    else:
+        title_key, org_key = ('title', 'company') if name == 'experience' else ('degree', 'school')
+        for item in value:
+            dates = ' - '.join(str(item[k]) for k in ('startDate', 'endDate') if item.get(k))
+            parts.append(
+                f'<div class="rs-item"><strong>{html.escape(str(item.get(title_key, "")))}</strong>'
+                f' <span class="rs-meta">{html.escape(str(item.get(org_key, "")))} {html.escape(dates)}</span>'
+                f'<p>{html.escape(str(item.get("description", "")))}</p></div>'
+            )
+    parts.append('</section>')
+    return ''.join(parts)
+
+
+def render_html(plan: RenderPlan, content: Dict[str, Any]) -> str:
+    """Render resume content; unchanged sections come from the fragment cache"""
+    parts = [plan.head]
+    for name in ('contact',) + plan.sections:
+        value = content.get(name)
+        if not value:
+            continue
+        key = (plan.key, name, _hash(value))
+        fragment = fragment_cache.get(key)
+        if fragment is None:
+            fragment = _render_header(value) if name == 'contact' else _render_section(plan, name, value)
+            fragment_cache[key] = fragment
+        parts.append(fragment)
+    parts.append(plan.tail)
+    return ''.join(parts)
+
+
+def _text_lines(plan: RenderPlan, content: Dict[str, Any]) -> List[Tuple[str, int, str, str]]:
+    """Flatten content into (font, size, color, text) lines for the PDF writer"""
+    lines = []
+    contact = content.get('contact')
+    if isinstance(contact, dict):
+        lines.append(('F2', 20, plan.primary, contact.get('name', '')))
+        lines.append(('F1', 10, plan.secondary, ' | '.join(
+            str(contact[k]) for k in ('email', 'phone', 'location') if contact.get(k))))
+    elif contact:
+        lines.append(('F1', 10, plan.secondary, str(contact)))
+
+    for name in plan.sections:
+        value = content.get(name)
+        if not value:
+            continue
+        lines.append(('F2', 13, plan.primary, SECTION_TITLES[name].upper()))
+        if name == 'summary':
+            lines.append(('F1', 10, plan.secondary, str(value)))
+        elif name == 'skills':
+            skills = value if isinstance(value, list) else [value]
+            lines.append(('F1', 10, plan.secondary, ', '.join(str(s) for s in skills)))
+        else:
+            title_key, org_key = ('title', 'company') if name == 'experience' else ('degree', 'school')
+            for item in value:
+                lines.append(('F2', 11, plan.secondary,
+                              f"{item.get(title_key, '')} - {item.get(org_key, '')}".strip(' -')))
+                if item.get('description'):
+                    lines.append(('F1', 10, plan.secondary, item['description']))
+    return lines
+
+
+def _pdf_escape(text: str) -> str:
+    text = text.encode('latin-1', 'replace').decode('latin-1')
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def render_pdf(plan: RenderPlan, content: Dict[str, Any]) -> bytes:
+    """Render a text-based PDF with the standard Helvetica fonts (no external renderer)"""
+    page_width, page_height, margin = 612, 792, 54
+    pages: List[List[str]] = [[]]
+    y = page_height - margin
+
+    for font, size, color, text in _text_lines(plan, content):
+        width = int((page_width - 2 * margin) / (size * 0.5))
+        leading = size * 1.4
+        if font == 'F2' and size >= 13:
+            y -= size * 0.6
+        r, g, b = _hex_to_rgb(color)
+        for chunk in textwrap.wrap(text, width) or ['']:
+            if y - leading < margin:
+                pages.append([])
+                y = page_height - margin
+            y -= leading
+            pages[-1].append(
+                f'BT /{font} {size} Tf {r:.3f} {g:.3f} {b:.3f} rg {margin} {y:.1f} Td ({_pdf_escape(chunk)}) Tj ET'
+            )
+
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        None,  # page tree, filled in once page object numbers are known
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>'
+    ]
+    page_refs = []
+    for page in pages:
+        stream = '\n'.join(page).encode('latin-1')
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream.decode("latin-1")}\nendstream')
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width} {page_height}] '
+            f'/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {len(objects)} 0 R >>'
+        )
+        page_refs.append(f'{len(objects)} 0 R')
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(page_refs)}] /Count {len(page_refs)} >>"
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1'))
+    xref = out.tell()
+    out.write(f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode())
+    for offset in offsets:
+        out.write(f'{offset:010d} 00000 n \n'.encode())
+    out.write(f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+    return out.getvalue()
+
+
+def _export_one(args: Tuple[Dict[str, Any], Dict[str, Any]]) -> bytes:
+    template, content = args
+    return render_pdf(compile_template(template), content)
+
+
+def _archive_name(resume: Dict[str, Any], index: int, used: Set[str]) -> str:
+    """Zip member name from the resume id: no directories, safe characters, unique"""
+    raw = str(resume.get('id', '')).replace('\\', '/').rsplit('/', 1)[-1]
+    base = ARCHIVE_NAME_RE.sub('_', raw).lstrip('.') or str(index + 1)
+    name, suffix = base, 2
+    while name in used:
+        name = f'{base}-{suffix}'
+        suffix += 1
+    used.add(name)
+    return f'{name}.pdf'
+
+
+def export_bulk(template: Dict[str, Any], resumes: List[Dict[str, Any]]) -> bytes:
+    """Render many resumes to PDF in a process pool and return them as a zip archive"""
+    global _export_pool
+    with _export_pool_lock:
+        if _export_pool is None:
+            _export_pool = ProcessPoolExecutor(max_workers=EXPORT_PROCESSES,
+                                               mp_context=multiprocessing.get_context(EXPORT_START_METHOD))
+
+    jobs = [(template, resume['content']) for resume in resumes]
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as archive:
+        used: Set[str] = set()
+        for index, pdf in enumerate(_export_pool.map(_export_one, jobs, chunksize=8)):
+            archive.writestr(_archive_name(resumes[index], index, used), pdf)
+    return out.getvalue()
+
+
+def preview_svg(plan: RenderPlan) -> str:
+    """Thumbnail sketch of the layout, generated on first request and cached"""
+    svg = _previews.get(plan.key)
+    if svg is not None:
+        return svg
+
+    blocks = []
+    header_height = 70 if LAYOUTS.get(plan.layout, {}).get('header') == 'banner' else 50
+    blocks.append(f'<rect x="0" y="0" width="300" height="{header_height}" fill="{plan.primary}" '
+                  f'opacity="{1 if header_height == 70 else 0.15}"/>')
+    y = header_height + 20
+    for name in plan.sections:
+        blocks.append(f'<rect x="20" y="{y}" width="120" height="10" fill="{plan.primary}"/>')
+        for line in range(3):
+            blocks.append(f'<rect x="20" y="{y + 18 + line * 12}" width="{260 - line * 30}" '
+                          f'height="6" fill="{plan.secondary}" opacity="0.4"/>')
+        y += 70
+    svg = (f'<svg xmlns="http://www.w3.org/2000/svg" width="300" height="{y}" viewBox="0 0 300 {y}">'
+           f'<rect width="300" height="{y}" fill="#ffffff"/>{"".join(blocks)}</svg>')
+    _previews[plan.key] = svg
+    return svg
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Resume Section Segmenter
+Splits plain-text resumes into the section dict ATSScanner.scan expects, in one pass
+"""
+
+import re
+from typing import Dict, List, Any
+
+# Header spellings per section (matched case-insensitively as a whole line,
+# or followed by a colon and the section's first content: "Skills: Python, SQL")
+SECTION_HEADERS = {
+    'summary': ['summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+                'objective', 'career objective', 'about me', 'about'],
+    'experience': ['experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history', 'career history', 'relevant experience'],
+    'education': ['education', 'academic background', 'education and training', 'academic history',
+                  'qualifications', 'education & training'],
+    'skills': ['skills', 'technical skills', 'core competencies', 'key skills', 'competencies',
+               'skills & abilities', 'skills and abilities', 'areas of expertise'],
+    'contact': ['contact', 'contact information', 'contact details', 'personal details',
+                'personal information'],
+    'other': ['certifications', 'certificates', 'licenses', 'projects', 'awards', 'languages',
+              'publications', 'volunteer experience', 'interests', 'references']
+}
+
+HEADER_RE = re.compile(
+    r'^\s*(?:#+\s*)?(?:' +
+    '|'.join(
+        f"(?P<{section}>{'|'.join(re.escape(h) for h in sorted(headers, key=len, reverse=True))})"
+        for section, headers in SECTION_HEADERS.items()
+    ) +
+    r')(?:\s*:?\s*$|\s*:\s*(?P<inline>\S.*))',
+    re.IGNORECASE
+)
+CONTACT_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.]+|\+?\d[\d\s().-]{7,}\d|linkedin\.com/\S+', re.IGNORECASE)
+ROLE_SPLIT_RE = re.compile(r'\s+(?:at|@|-|–|—|\|)\s+|,\s+')
+SKILL_SPLIT_RE = re.compile(r'[,;|•·\n]|\s+-\s+')
+BULLET_RE = re.compile(r'^\s*(?:[-*•·]|\d+[.)])\s*')
+
+
+def _entries(lines: List[str]) -> List[List[str]]:
+    """Group section lines into blank-line separated entries"""
+    entries: List[List[str]] = [[]]
+    for line in lines:
+        if line.strip():
+            entries[-1].append(line.strip())
+        elif entries[-1]:
+            entries.append([])
+    return [e for e in entries if e]
+
+
+def _parse_roles(lines: List[str], title_key: str, org_key: str) -> List[Dict[str, str]]:
+    items = []
+    for entry in _entries(lines):
+        heading = BULLET_RE.sub('', entry[0])
+        parts = ROLE_SPLIT_RE.split(heading, maxsplit=1)
+        items.append({
+            title_key: parts[0],
+            org_key: parts[1] if len(parts) > 1 else '',
+            'description': ' '.join(BULLET_RE.sub('', line) for line in entry[1:])
+        })
+    return items
+
+
+def _parse_skills(lines: List[str]) -> List[str]:
+    skills = []
+    for line in lines:
+        for skill in SKILL_SPLIT_RE.split(BULLET_RE.sub('', line)):
+            skill = skill.strip()
+            if skill and skill not in skills:
+                skills.append(skill)
+    return skills
+
+
+def segment_resume(text: str) -> Dict[str, Any]:
+    """Detect section headers and return {'summary', 'experience', 'education', 'skills', 'contact'}
+
+    Lines before the first header are treated as contact details when they
+    contain an email, phone number or profile link, otherwise as the summary.
+    """
+    sections: Dict[str, List[str]] = {'preamble': []}
+    current = 'preamble'
+    for line in text.splitlines():
+        match = HEADER_RE.match(line)
+        if match:
+            current = next(section for section in SECTION_HEADERS if match.group(section))
+            sections.setdefault(current, [])
+            if match.group('inline'):
+                sections[current].append(match.group('inline'))
+        else:
+            sections[current].append(line)
+
+    preamble = [line.strip() for line in sections.pop('preamble') if line.strip()]
+    contact_lines = list(sections.get('contact', []))
+    summary_lines = list(sections.get('summary', []))
+    if preamble:
+        if any(CONTACT_RE.search(line) for line in preamble):
+            contact_lines = preamble + contact_lines
+        elif 'summary' not in sections:
+            summary_lines = preamble
+
+    content: Dict[str, Any] = {}
+    contact = ' | '.join(line.strip() for line in contact_lines if line.strip())
+    if contact:
+        content['contact'] = contact
+    summary = ' '.join(line.strip() for line in summary_lines if line.strip())
+    if summary:
+        content['summary'] = summary
+    if sections.get('experience'):
+        content['experience'] = _parse_roles(sections['experience'], 'title', 'company')
+    if sections.get('education'):
+        content['education'] = _parse_roles(sections['education'], 'degree', 'school')
+    if sections.get('skills'):
+        content['skills'] = _parse_skills(sections['skills'])
+    other = ' '.join(line.strip() for line in sections.get('other', []) if line.strip())
+    if other:
+        content['other'] = other
+    return content
+
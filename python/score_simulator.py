@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Score Simulator
+What-if score deltas for every candidate resume edit, computed in one pass over a scan result
+"""
+
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+# Keyword, structure and readability weights of the overall score (see ATSScanner.combine_scores)
+COMPONENT_WEIGHTS = np.array([0.6, 0.3, 0.1])
+
+# Readability score the "simplify language" action aims for (the 'standard' band)
+READABILITY_TARGET = 60.0
+
+
+def simulate(result: Dict[str, Any], keyword_weights: Optional[Dict[str, float]] = None,
+             readability_target: float = READABILITY_TARGET) -> Dict[str, Any]:
+    """Rank single edits by how much each raises the overall score
+
+    `result` is a scan result (fresh or from the scan cache); nothing is
+    rescanned. Each candidate edit is one row of component deltas, and every
+    row is scored with one matrix product. `keyword_weights` are a job
+    profile's weights; without them every keyword counts the same.
+    """
+    keywords = result['keywords']
+    structure = result['structure']
+    readability = result['readability']
+    components = np.array([keywords['score'], structure['score'], readability['score']], dtype=np.float64)
+    base = components @ COMPONENT_WEIGHTS
+
+    actions: List[Dict[str, str]] = []
+    rows: List[List[float]] = []
+
+    missing = keywords['missing']
+    if missing:
+        if keyword_weights:
+            total_weight = sum(keyword_weights.values())
+            gains = np.array([keyword_weights.get(k, 0.0) for k in missing]) / total_weight * 100
+        else:
+            gains = np.full(len(missing), 100 / keywords['total_possible'])
+        actions.extend({'type': 'keyword', 'target': k, 'action': f'Add the keyword "{k}"'} for k in missing)
+        rows.extend([gain, 0.0, 0.0] for gain in gains)
+
+    sections_total = len(structure['present']) + len(structure['missing'])
+    for section in structure['missing']:
+        actions.append({'type': 'section', 'target': section, 'action': f'Add the {section} section'})
+        rows.append([0.0, 100 / sections_total, 0.0])
+
+    if readability['score'] < readability_target:
+        actions.append({'type': 'readability', 'target': str(readability_target),
+                        'action': 'Simplify language and use shorter sentences'})
+        rows.append([0.0, 0.0, readability_target - readability['score']])
+
+    if not rows:
+        return {'score': result['score'], 'maxScore': result['score'], 'actions': []}
+
+    deltas = np.array(rows)
+    projected = np.minimum(components + deltas, 100) @ COMPONENT_WEIGHTS
+    new_scores = projected.astype(np.int64)
+    order = np.argsort(base - projected, kind='stable')
+    all_applied = np.minimum(components + deltas.sum(axis=0), 100) @ COMPONENT_WEIGHTS
+
+    ranked = []
+    for i in order:
+        ranked.append(dict(
+            actions[i],
+            gain=round(float(projected[i] - base), 2),
+            newScore=int(new_scores[i]),
+            scoreDelta=int(new_scores[i]) - result['score']
+        ))
+    return {'score': result['score'], 'maxScore': int(all_applied), 'actions': ranked}
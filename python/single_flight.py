@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Single-Flight Request Coalescing
+Concurrent calls with the same key share one computation, within a worker and across workers
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Callable, Optional
+
+COALESCE_DIR = os.environ.get('COALESCE_DIR', '/tmp/resumesmartbuild_inflight')
+
+
+def content_hash(*parts: Any) -> str:
+    """Stable hash of JSON-serializable request inputs"""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class _Call:
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Run fn once per key while it is in flight; everyone else waits for that result
+
+    Threads in one process wait on an Event. Processes coordinate through an
+    flock lease per key: the holder computes and publishes the outcome to a
+    file that later lock holders reuse while it is fresh. The kernel drops the
+    lease if its holder dies, so a crashed worker never wedges the key.
+    Failures are published too, but only to callers that were already waiting
+    on the failed computation; later calls discard them and retry.
+    """
+
+    def __init__(self, directory: str = COALESCE_DIR, result_ttl: float = 5.0,
+                 timeout: float = 30.0, poll_interval: float = 0.01):
+        self.directory = directory
+        self.result_ttl = result_ttl
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.coalesced = 0
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        os.makedirs(directory, exist_ok=True)
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not call.done.wait(self.timeout):
+                # Leader is stuck; compute locally rather than fail the request
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = self._do_shared(key, fn)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+    def _do_shared(self, key: str, fn: Callable[[], Any]) -> Any:
+        lock_path = os.path.join(self.directory, f'{key}.lock')
+        result_path = os.path.join(self.directory, f'{key}.json')
+        waiting_since = time.time()
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT)
+        try:
+            deadline = time.monotonic() + self.timeout
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() > deadline:
+                        # Leader is stuck; compute locally rather than hang the request
+                        return fn()
+                    time.sleep(self.poll_interval)
+
+            try:
+                outcome = self._read_fresh(result_path)
+                if outcome is not None and not outcome['ok'] and outcome['finished_at'] < waiting_since:
+                    # Failure of a computation this call never waited on: retry
+                    self._discard(result_path)
+                    outcome = None
+                if outcome is not None:
+                    self.coalesced += 1
+                    if not outcome['ok']:
+                        raise RuntimeError(f"{outcome['error_type']}: {outcome['error']}")
+                    return outcome['value']
+
+                os.utime(lock_path)
+                try:
+                    value = fn()
+                except Exception as e:
+                    self._publish(result_path, {'ok': False, 'error': str(e),
+                                                'error_type': type(e).__name__,
+                                                'finished_at': time.time()})
+                    raise
+                self._publish(result_path, {'ok': True, 'value': value})
+                return value
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+            self._maybe_prune()
+
+    def _read_fresh(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            if time.time() - os.path.getmtime(path) > self.result_ttl:
+                return None
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _publish(self, path: str, outcome: Dict[str, Any]) -> None:
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}'
+        with open(tmp_path, 'w') as f:
+            json.dump(outcome, f)
+        os.replace(tmp_path, path)
+
+    def _discard(self, path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def _maybe_prune(self) -> None:
+        """Remove stale lease and result files at most once a minute"""
+        now = time.time()
+        if now - self._last_prune < 60:
+            return
+        self._last_prune = now
+        cutoff = now - max(self.result_ttl, self.timeout) * 2
+        for entry in os.scandir(self.directory):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'in_flight': len(self._calls), 'coalesced': self.coalesced}
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Skill-Gap Recommender
+Ranks missing keywords using a keyword co-occurrence (PMI) matrix precomputed from a local corpus
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, List, Iterator, Optional, TYPE_CHECKING
+
+import numpy as np
+from scipy import sparse
+
+if TYPE_CHECKING:
+    from ats_scanner import ATSScanner
+
+DEFAULT_MATRIX_DIR = os.environ.get(
+    'SKILL_MATRIX_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'skill_pmi')
+)
+
+# Weight of how common a skill is in postings relative to its PMI with the resume's skills
+PRIOR_WEIGHT = 0.5
+
+
+class SkillRecommender:
+    def __init__(self, vocabulary: List[str], pmi: sparse.csr_matrix, log_prior: np.ndarray):
+        self.vocabulary = vocabulary
+        self.index = {keyword: i for i, keyword in enumerate(vocabulary)}
+        self.pmi = pmi
+        self.log_prior = log_prior
+
+    @classmethod
+    def load(cls, directory: str = DEFAULT_MATRIX_DIR) -> 'SkillRecommender':
+        """Memory-map a matrix written by `build`; pages are shared across workers"""
+        with open(os.path.join(directory, 'vocabulary.json')) as f:
+            vocabulary = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+            for name in ('data', 'indices', 'indptr', 'log_prior')
+        }
+        size = len(vocabulary)
+        pmi = sparse.csr_matrix((arrays['data'], arrays['indices'], arrays['indptr']),
+                                shape=(size, size), copy=False)
+        return cls(vocabulary, pmi, arrays['log_prior'])
+
+    @classmethod
+    def load_default(cls) -> Optional['SkillRecommender']:
+        """The shipped matrix, or None when it has not been built"""
+        if not os.path.exists(os.path.join(DEFAULT_MATRIX_DIR, 'vocabulary.json')):
+            return None
+        return cls.load(DEFAULT_MATRIX_DIR)
+
+    def scores(self, found: List[str], missing: List[str]) -> np.ndarray:
+        """Relevance of each missing keyword given the keywords already present"""
+        missing_idx = np.array([self.index.get(k.lower(), -1) for k in missing], dtype=np.int64)
+        known = missing_idx >= 0
+        result = np.full(len(missing), -np.inf)
+        if not known.any():
+            return result
+
+        found_idx = [self.index[k.lower()] for k in found if k.lower() in self.index]
+        relevance = np.zeros(len(self.vocabulary))
+        if found_idx:
+            relevance = np.asarray(self.pmi[found_idx].sum(axis=0)).ravel()
+        result[known] = relevance[missing_idx[known]] + PRIOR_WEIGHT * self.log_prior[missing_idx[known]]
+        return result
+
+    def rank(self, found: List[str], missing: List[str]) -> List[str]:
+        """Missing keywords ordered by relevance (taxonomy order breaks ties)"""
+        if not missing:
+            return []
+        order = np.argsort(-self.scores(found, missing), kind='stable')
+        return [missing[i] for i in order]
+
+
+def _iter_corpus(path: str) -> Iterator[str]:
+    """Documents from a .jsonl file ('text' field) or a directory of .txt/.md files"""
+    if os.path.isdir(path):
+        for root, _, files in os.walk(path):
+            for name in sorted(files):
+                if name.endswith(('.txt', '.md')):
+                    with open(os.path.join(root, name), encoding='utf-8', errors='ignore') as f:
+                        yield f.read()
+    else:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)['text']
+
+
+def build(corpus: str, output: str, scanner: 'ATSScanner') -> Dict[str, int]:
+    """Count keyword co-occurrence over the corpus and write a positive-PMI matrix
+
+    A keyword is present in a document exactly when the scanner would find
+    it in a resume (stemmed phrase match), so the matrix agrees with scans.
+    """
+    from text_normalizer import normalize_text
+
+    vocabulary: List[str] = []
+    for keyword in scanner.all_keywords:
+        if keyword.lower() not in vocabulary:
+            vocabulary.append(keyword.lower())
+    index = {keyword: i for i, keyword in enumerate(vocabulary)}
+
+    rows: List[int] = []
+    cols: List[int] = []
+    documents = 0
+    for text in _iter_corpus(corpus):
+        present = sorted({index[k.lower()] for k in scanner.keyword_matcher.find(normalize_text(text))})
+        rows.extend([documents] * len(present))
+        cols.extend(present)
+        documents += 1
+
+    size = len(vocabulary)
+    occurrence = sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)),
+                                   shape=(documents, size))
+    counts = np.asarray(occurrence.sum(axis=0)).ravel()
+    cooccurrence = (occurrence.T @ occurrence).tocoo()
+
+    mask = cooccurrence.row != cooccurrence.col
+    i, j, n_ij = cooccurrence.row[mask], cooccurrence.col[mask], cooccurrence.data[mask]
+    pmi = np.log(n_ij * documents / (counts[i] * counts[j]))
+    positive = pmi > 0
+    matrix = sparse.csr_matrix((pmi[positive].astype(np.float32), (i[positive], j[positive])),
+                               shape=(size, size))
+    log_prior = np.log((counts + 1) / (documents + size)).astype(np.float32)
+
+    os.makedirs(output, exist_ok=True)
+    with open(os.path.join(output, 'vocabulary.json'), 'w') as f:
+        json.dump(vocabulary, f)
+    np.save(os.path.join(output, 'data.npy'), matrix.data)
+    np.save(os.path.join(output, 'indices.npy'), matrix.indices)
+    np.save(os.path.join(output, 'indptr.npy'), matrix.indptr)
+    np.save(os.path.join(output, 'log_prior.npy'), log_prior)
+    return {'documents': documents, 'keywords': size, 'pairs': int(matrix.nnz)}
+
+
+def main():
+    from content_snapshots import SnapshotStore
+
+    parser = argparse.ArgumentParser(description='Build the skill co-occurrence matrix')
+    parser.add_argument('corpus', help='.jsonl file with a "text" field, or a directory of .txt/.md files')
+    parser.add_argument('--out', default=DEFAULT_MATRIX_DIR)
+    args = parser.parse_args()
+
+    # Vocabulary and matching come from the active content version's taxonomy
+    snapshot = SnapshotStore({'taxonomy': {}, 'templates': [], 'articles': []}).current()
+    print(json.dumps(dict(build(args.corpus, args.out, snapshot.scanner), content_version=snapshot.version)))
+
+
+if __name__ == '__main__':
+    main()
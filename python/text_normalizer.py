@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Text Normalizer
+Stems resume tokens and taxonomy terms to a shared form so inflections match
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Iterable, Set, Tuple
+
+from nltk.stem import PorterStemmer
+
+# Word characters plus the symbols that are part of skill names (c++, c#)
+TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+
+# Related words the stemmer leaves apart ("leadership" vs "led teams")
+STEM_ALIASES = {
+    'led': 'lead',
+    'leader': 'lead',
+    'leadership': 'lead',
+    'analysi': 'analyt',
+    'analyz': 'analyt',
+    'analyst': 'analyt',
+}
+
+# Distinct tokens kept in the memo; resume vocabularies repeat heavily
+CACHE_SIZE = 65536
+
+_stemmer = PorterStemmer()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_token(token: str) -> str:
+    """Stemmed, alias-resolved form of one lowercase token"""
+    if len(token) <= 2 or not token.isalpha():
+        return token
+    stem = _stemmer.stem(token)
+    return STEM_ALIASES.get(stem, stem)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase tokens; punctuation separates them, so node.js and ci/cd become two"""
+    return TOKEN_RE.findall(text.lower())
+
+
+def normalize_text(text: str) -> Tuple[str, ...]:
+    return tuple(normalize_token(token) for token in tokenize(text))
+
+
+def normalize_many(texts: Iterable[str]) -> List[Tuple[str, ...]]:
+    """Normalize a batch of documents, stemming each distinct token once"""
+    tokenized = [tokenize(text) for text in texts]
+    forms: Dict[str, str] = {}
+    for tokens in tokenized:
+        for token in tokens:
+            if token not in forms:
+                forms[token] = normalize_token(token)
+    return [tuple(forms[token] for token in tokens) for tokens in tokenized]
+
+
+class PhraseMatcher:
+    """Finds which of a fixed set of phrases occur in a normalized token sequence
+
+    Phrases are normalized once at construction; matching is one dict lookup
+    per token position and distinct phrase length.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases: Dict[Tuple[str, ...], List[str]] = {}
+        self.known: Set[str] = set()
+        for phrase in phrases:
+            if phrase in self.known:
+                continue
+            self.known.add(phrase)
+            key = normalize_text(phrase)
+            if key:
+                self.phrases.setdefault(key, []).append(phrase)
+        self.lengths = sorted({len(key) for key in self.phrases})
+
+    def __contains__(self, phrase: str) -> bool:
+        return phrase in self.known
+
+    def find(self, tokens: Tuple[str, ...]) -> Set[str]:
+        """Original spellings of every phrase present in tokens"""
+        found: Set[str] = set()
+        for n in self.lengths:
+            for i in range(len(tokens) - n + 1):
+                phrases = self.phrases.get(tokens[i:i + n])
+                if phrases:
+                    found.update(phrases)
+        return found
+
+    def counts(self, tokens: Tuple[str, ...]) -> Dict[str, int]:
+        """How many times each present phrase occurs in tokens"""
+        counts: Dict[str, int] = {}
+        for n in self.lengths:
+            for i in range(len(tokens) - n + 1):
+                for phrase in self.phrases.get(tokens[i:i + n], ()):
+                    counts[phrase] = counts.get(phrase, 0) + 1
+        return counts
@@ -2,19 +2,100 @@
 """
 ResumeSmartBuild - Comprehensive AI-Powered Resume Builder Server
 """
+import cProfile
+import functools
+import hashlib
+import hmac
 import json
+import secrets
 import time
-import random
 import re
 import os
-from flask import Flask, request, jsonify, send_from_directory
+import sys
+import threading
+import tracemalloc
+from flask import Flask, request, jsonify, send_from_directory, g, Response, has_request_context
+from werkzeug.utils import safe_join
 from flask_cors import CORS
 
+# Opt-in allocation tracing for /api/admin/memory (value = stack frames kept)
+if os.environ.get('TRACEMALLOC'):
+    tracemalloc.start(int(os.environ['TRACEMALLOC']))
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+from admission import AdmissionController, Overloaded
+from content_snapshots import SnapshotStore
+from job_queue import JobQueue, JOB_HANDLERS, PRIORITY_LANES
+from job_profiles import compile_profile, job_profiles
+from resume_dedup import DEFAULT_SIMILARITY_THRESHOLD, scan_deduplicated
+from memory_budget import BoundedStore, ScanRecord, approx_size, memory_report, MB
+from single_flight import SingleFlight, content_hash
+from resume_segmenter import segment_resume
+from score_simulator import READABILITY_TARGET, simulate
+from resume_renderer import compile_template, render_html, render_pdf, export_bulk, preview_svg
+from profiler import (ProfileSession, StackSampler, SESSION_CHECK_INTERVAL,
+                      to_collapsed, to_speedscope, cprofile_summary)
+
 app = Flask(__name__, static_folder='.')
 CORS(app)
 
+# Jobs accepted by one multi-target scan request
+MAX_SCAN_TARGETS = 50
+
+# Resumes accepted by one synchronous batch scan request
+MAX_BATCH_RESUMES = 200
+
+# Resumes accepted by one bulk PDF export request
+MAX_EXPORT_RESUMES = 500
+
+# Admin-only surfaces (profiling) require this token in X-Admin-Token
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
+# Signs the bearer tokens issued at login (generated before fork when unset, so workers agree)
+SESSION_SECRET = os.environ.get('SESSION_SECRET') or secrets.token_hex(32)
+
+# Routes behind admission control, by kind; other routes are cheap and bypass it
+ADMISSION_ROUTES = {
+    'ats_scan': 'interactive',
+    'ats_scan_multi': 'interactive',
+    'render_template_html': 'interactive',
+    'export_template_pdf': 'interactive',
+    'match_jobs': 'interactive',
+    'generate_cover_letter': 'interactive',
+    'create_job_profile': 'interactive',
+    'simulate_score': 'interactive',
+    'ats_scan_batch': 'batch',
+    'export_template_bulk': 'batch',
+    'import_articles': 'batch',
+}
+
+# Priority queue and per-class slot limits for the routes above (per worker)
+admission = AdmissionController()
+
+profile_session = ProfileSession()
+stack_sampler = StackSampler()
+_profile_state = {'checked_at': 0.0, 'session': None}
+
+# Durable queue for scans too slow to run inside a request worker
+job_queue = JobQueue()
+
+# Byte budgets for in-process state, so workers can live without recycling
+USERS_MEMORY_BUDGET = int(os.environ.get('USERS_MEMORY_MB', 64)) * MB
+ARTICLES_MEMORY_BUDGET = int(os.environ.get('ARTICLES_MEMORY_MB', 64)) * MB
+SCAN_CACHE_MEMORY_BUDGET = int(os.environ.get('SCAN_CACHE_MEMORY_MB', 32)) * MB
+
+# Recent scan results keyed by content hash
+scan_cache = BoundedStore('scan_results', SCAN_CACHE_MEMORY_BUDGET)
+
+# Identical concurrent scans share one computation across threads and workers
+scan_flight = SingleFlight()
+
 # Mock databases (in production, use PostgreSQL)
+# Accounts are data, not cache: never evicted, registration is refused once over budget
 users_db = {}
+user_memory = {'bytes': 0}
+# Held for the duplicate check, budget check and insert of a registration
+users_lock = threading.Lock()
 templates_db = [
     {
         'id': '1',
@@ -145,6 +226,32 @@ Remember: the best template is one that highlights your qualifications while rem
     }
 ]
 
+article_memory = {'bytes': approx_size(articles_db)}
+
+# Serializes article writes (create, import, content reload) across gthread
+# request threads: slug checks, id assignment and appends must not interleave
+articles_lock = threading.Lock()
+
+# Reloadable taxonomy, templates and seeded articles. templates_db and the
+# initial articles_db are the built-in version; the scanner taxonomy defaults
+# to ATSScanner's own.
+content_snapshots = SnapshotStore({
+    'taxonomy': {},
+    'templates': templates_db,
+    'articles': [dict(a) for a in articles_db]
+})
+
+def merge_seeded_articles(old, new):
+    """Swap seeded articles for the new version's, keeping admin-created ones"""
+    old_slugs = {a['slug'] for a in old.articles}
+    seeded = [dict(a) for a in new.articles]
+    with articles_lock:
+        created = [a for a in articles_db if a['slug'] not in old_slugs]
+        articles_db[:] = seeded + created
+        rebuild_article_indexes(seeded)
+
+content_snapshots.listeners.append(merge_seeded_articles)
+
 # Helper functions
 def extract_keywords(text):
     """Extract keywords from text for SEO"""
@@ -165,9 +272,220 @@ def markdown_to_html(markdown_text):
     html = f'<p>{html}</p>'
     return html
 
+# Slug -> article, rebuilt in one pass after bulk changes
+articles_by_slug = {}
+
+def slugify(title):
+    slug = re.sub(r'[^a-zA-Z0-9\s]', '', title).lower()
+    return re.sub(r'\s+', '-', slug.strip())
+
+# Optional article fields that must be strings when present
+ARTICLE_TEXT_FIELDS = ('content', 'excerpt', 'author', 'category', 'created_at', 'cover_image_url')
+
+def article_field_error(data):
+    """Why an imported article row is unusable, or None"""
+    if not isinstance(data, dict) or not data.get('title'):
+        return 'Missing title'
+    if not isinstance(data['title'], str):
+        return 'Field title must be a string'
+    for field in ARTICLE_TEXT_FIELDS:
+        if data.get(field) is not None and not isinstance(data[field], str):
+            return f'Field {field} must be a string'
+    if 'is_featured' in data and not isinstance(data['is_featured'], bool):
+        return 'Field is_featured must be true or false'
+    if 'slug' in data and not isinstance(data['slug'], str):
+        return 'Field slug must be a string'
+    return None
+
+def rebuild_article_indexes(changed_articles=()):
+    """Render HTML and SEO keywords for changed articles, then rebuild the slug index
+
+    The new index replaces the old one in a single assignment, so lookups
+    from other threads never see it half built.
+    """
+    global articles_by_slug
+    for article in changed_articles:
+        article['content_html'] = markdown_to_html(article.get('content', ''))
+        article['keywords'] = extract_keywords(article.get('content', ''))
+    articles_by_slug = {a['slug']: a for a in articles_db}
+    article_memory['bytes'] = approx_size(articles_db)
+
+def parse_markdown_article(text, filename):
+    """Article dict from a markdown file with optional '---' key: value front matter"""
+    meta = {}
+    if text.startswith('---\n'):
+        end = text.find('\n---', 4)
+        if end != -1:
+            for line in text[4:end].splitlines():
+                key, _, value = line.partition(':')
+                if key.strip():
+                    meta[key.strip()] = value.strip()
+            text = text[end + 4:].lstrip('\n')
+    if 'is_featured' in meta:
+        meta['is_featured'] = meta['is_featured'].lower() in ('true', 'yes', '1')
+    if not meta.get('title'):
+        heading = re.search(r'^# (.+)$', text, flags=re.MULTILINE)
+        meta['title'] = heading.group(1).strip() if heading else os.path.splitext(filename)[0]
+    meta['content'] = text
+    return meta
+
+def iter_markdown_directory(directory):
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith('.md'):
+            with open(os.path.join(directory, filename), encoding='utf-8') as f:
+                yield filename, parse_markdown_article(f.read(), filename)
+
+def iter_ndjson(stream):
+    for line_number, raw in enumerate(stream, 1):
+        if raw.strip():
+            yield line_number, json.loads(raw)
+
+rebuild_article_indexes(articles_db)
+
+def is_admin_request():
+    token = request.headers.get('X-Admin-Token', '')
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+def require_admin(view):
+    """Reject requests without a valid admin token"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not is_admin_request():
+            return jsonify({'message': 'Admin access required'}), 403
+        return view(*args, **kwargs)
+    return wrapper
+
+def issue_token(email):
+    signature = hmac.new(SESSION_SECRET.encode(), email.encode(), hashlib.sha256).hexdigest()
+    return f'{email}.{signature}'
+
+def current_user():
+    """User for the request's bearer token, or None"""
+    header = request.headers.get('Authorization', '')
+    if not header.startswith('Bearer '):
+        return None
+    email, _, signature = header[len('Bearer '):].rpartition('.')
+    expected = hmac.new(SESSION_SECRET.encode(), email.encode(), hashlib.sha256).hexdigest()
+    # compare_digest only takes ASCII str; bytes also cover arbitrary header text
+    if not email or not hmac.compare_digest(signature.encode(), expected.encode()):
+        return None
+    return users_db.get(email)
+
+def admission_class():
+    """'premium', 'free' or 'batch' for routes under admission control, else None"""
+    kind = ADMISSION_ROUTES.get(request.endpoint)
+    if kind is None:
+        return None
+    if kind == 'batch':
+        return 'batch'
+    user = current_user()
+    return 'premium' if user and user.get('isPremium') else 'free'
+
+def current_profile_session():
+    """Active sampling session, re-read from disk at most once per interval"""
+    now = time.time()
+    if now - _profile_state['checked_at'] >= SESSION_CHECK_INTERVAL:
+        _profile_state['session'] = profile_session.active()
+        _profile_state['checked_at'] = now
+    return _profile_state['session']
+
+# Admission control: runs first so shed requests do no other work
+@app.before_request
+def admit_request():
+    request_class = admission_class()
+    if request_class is None:
+        return None
+    try:
+        admission.acquire(request_class)
+    except Overloaded as e:
+        response = jsonify({'message': str(e), 'retryAfter': e.retry_after})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response
+    g.admission = (request_class, time.monotonic())
+
+@app.teardown_request
+def release_admission(exc):
+    admitted = g.pop('admission', None)
+    if admitted:
+        request_class, started = admitted
+        admission.release(request_class, time.monotonic() - started)
+
+@app.before_request
+def pin_snapshot():
+    g.snapshot = content_snapshots.current()
+
+# Profiling hooks: diagnostics must never fail the request they observe
+@app.before_request
+def start_profiling():
+    try:
+        session = current_profile_session()
+        if session and request.path == session['route'] and profile_session.is_open(session):
+            stack_sampler.begin(session)
+            g.profile_session_id = session['id']
+        
+        if request.headers.get('X-Profile') and is_admin_request():
+            g.cprofile = cProfile.Profile()
+            g.cprofile.enable()
+    except Exception:
+        app.logger.exception('Profiling disabled for this request')
+
+@app.after_request
+def attach_profile(response):
+    profile = g.pop('cprofile', None)
+    if profile is not None:
+        try:
+            profile.disable()
+            data = response.get_json(silent=True) if response.is_json else None
+            if isinstance(data, dict):
+                data['profile'] = cprofile_summary(profile)
+                response.set_data(json.dumps(data))
+        except Exception:
+            app.logger.exception('Could not attach profile')
+    return response
+
+@app.teardown_request
+def finish_profiling(exc):
+    session_id = g.pop('profile_session_id', None)
+    if session_id:
+        try:
+            stacks = stack_sampler.end()
+            profile_session.record_request(session_id)
+            profile_session.write_stacks(session_id, stacks)
+        except Exception:
+            app.logger.exception('Could not record profile stacks')
+
+def current_snapshot():
+    """Snapshot pinned for this request, so it finishes on the version it started with"""
+    if has_request_context() and 'snapshot' in g:
+        return g.snapshot
+    return content_snapshots.current()
+
+def cached_scan(content, job_position='general', job_description=None, job_profile=None):
+    """ATSScanner.scan with coalescing and results kept as compact records"""
+    snapshot = current_snapshot()
+    if job_profile is not None:
+        key = content_hash('scan_profile', snapshot.taxonomy_digest, content, job_profile.id)
+        compute = lambda: snapshot.scanner.scan_profile(content, job_profile)
+    else:
+        key = content_hash('scan', snapshot.taxonomy_digest, content, job_position, job_description)
+        compute = lambda: snapshot.scanner.scan(content, job_position, job_description)
+    record = scan_cache.get(key)
+    if record is None:
+        result = scan_flight.do(key, compute)
+        record = ScanRecord(result)
+        scan_cache[key] = record
+    return record.to_dict()
+
+# Static pages read into memory by preload(), shared by every forked worker
+static_pages = {}
+
 # Main routes
 @app.route('/')
 def serve_homepage():
+    page = static_pages.get('index.html')
+    if page is not None:
+        return Response(page, mimetype='text/html')
     return send_from_directory('.', 'index.html')
 
 @app.route('/api/health')
@@ -188,16 +506,26 @@ def register():
     if email in users_db:
         return jsonify({'message': 'User already exists'}), 400
     
-    users_db[email] = {
+    user = {
         'email': email,
         'password': password,  # In production: hash this!
         'name': name,
+        'isPremium': False,
         'created_at': time.time()
     }
+    user_size = approx_size(email) + approx_size(user)
+    with users_lock:
+        if email in users_db:
+            return jsonify({'message': 'User already exists'}), 400
+        if user_memory['bytes'] + user_size > USERS_MEMORY_BUDGET:
+            return jsonify({'message': 'User storage budget exceeded'}), 507
+        users_db[email] = user
+        user_memory['bytes'] += user_size
     
     return jsonify({
         'message': 'User registered successfully',
-        'user': {'email': email, 'name': name}
+        'user': {'email': email, 'name': name, 'isPremium': False},
+        'token': issue_token(email)
     }), 201
 
 @app.route('/api/auth/login', methods=['POST'])
@@ -215,7 +543,8 @@ def login():
     
     return jsonify({
         'message': 'Login successful',
-        'user': {'email': user['email'], 'name': user['name']}
+        'user': {'email': user['email'], 'name': user['name'], 'isPremium': user.get('isPremium', False)},
+        'token': issue_token(email)
     }), 200
 
 # ATS Scanning endpoint
@@ -225,39 +554,39 @@ def ats_scan():
         data = request.get_json()
         resume_text = data.get('resume', '')
         job_description = data.get('jobDescription', '')
+        job_profile_id = data.get('jobProfileId')
         
-        if not resume_text or not job_description:
-            return jsonify({'message': 'Resume and job description are required'}), 400
-        
-        # Mock ATS analysis
-        keywords_found = []
-        missing_keywords = []
-        
-        job_keywords = ['python', 'javascript', 'react', 'node.js', 'sql', 'git', 'aws', 'leadership', 'management']
-        resume_lower = resume_text.lower()
+        if not resume_text or not (job_description or job_profile_id):
+            return jsonify({'message': 'Resume and job description (or jobProfileId) are required'}), 400
         
-        for keyword in job_keywords:
-            if keyword.lower() in resume_lower:
-                keywords_found.append(keyword)
-            else:
-                missing_keywords.append(keyword)
+        job_profile = None
+        if job_profile_id:
+            job_profile = job_profiles.get(job_profile_id)
+            if not job_profile:
+                return jsonify({'message': 'Job profile not found'}), 404
         
-        match_score = min(95, max(60, len(keywords_found) * 10 + random.randint(-5, 15)))
+        # Segment the plain-text resume and run the full scanner in-process
+        content = segment_resume(resume_text)
+        if job_profile:
+            analysis = cached_scan(content, job_profile=job_profile)
+        else:
+            analysis = cached_scan(content, job_description=job_description)
+        match_score = analysis['score']
+        missing_keywords = analysis['keywords']['missing']
         
         suggestions = [
-            f"Add missing keywords: {', '.join(missing_keywords[:3])}" if missing_keywords else "Great keyword coverage!",
-            "Use bullet points for better readability",
-            "Quantify your achievements with numbers",
-            "Include relevant certifications",
-            "Optimize section headings for ATS parsing"
-        ]
+            f"Add missing keywords: {', '.join(missing_keywords[:3])}" if missing_keywords else "Great keyword coverage!"
+        ] + analysis['suggestions']
         
         result = {
             'matchScore': match_score,
-            'keywordsFound': keywords_found,
+            'keywordsFound': analysis['keywords']['found'],
             'missingKeywords': missing_keywords,
             'suggestions': suggestions[:4],
             'overallFeedback': f'Your resume scored {match_score}%. Focus on adding missing keywords and quantifiable achievements.',
+            'industry': analysis['industry'],
+            'sections': analysis['structure'],
+            'readability': analysis['readability'],
             'analysisDate': time.time()
         }
         
@@ -266,18 +595,286 @@ def ats_scan():
     except Exception as e:
         return jsonify({'message': 'Analysis failed', 'error': str(e)}), 500
 
+# What-if simulator: score delta of each possible edit, from the cached scan
+@app.route('/api/ats-scan/simulate', methods=['POST'])
+def simulate_score():
+    try:
+        data = request.get_json()
+        resume_text = data.get('resume', '')
+        content = request_resume_content(data)
+        job_description = data.get('jobDescription')
+        job_profile_id = data.get('jobProfileId')
+        
+        if not resume_text and not content:
+            return jsonify({'message': 'Resume text or content is required'}), 400
+        
+        job_profile = None
+        if job_profile_id:
+            job_profile = job_profiles.get(job_profile_id)
+            if not job_profile:
+                return jsonify({'message': 'Job profile not found'}), 404
+        
+        if content is None:
+            content = segment_resume(resume_text)
+        # Repeated calls while editing hit the scan cache unless the resume changed
+        result = cached_scan(content, data.get('jobPosition', 'general'), job_description or None, job_profile)
+        simulation = simulate(
+            result,
+            keyword_weights=job_profile.weights if job_profile else None,
+            readability_target=float(data.get('readabilityTarget', READABILITY_TARGET))
+        )
+        simulation['actions'] = simulation['actions'][:int(data.get('limit', 20))]
+        return jsonify(simulation), 200
+        
+    except Exception as e:
+        return jsonify({'message': 'Simulation failed', 'error': str(e)}), 500
+
+# Multi-target scan: analyze the resume once, score it against many jobs
+def scan_target_error(jobs):
+    """Why a scan_many job list is unusable, or None"""
+    if not isinstance(jobs, list):
+        return 'jobs must be a list'
+    for index, job in enumerate(jobs):
+        if isinstance(job, str):
+            continue
+        if not isinstance(job, dict):
+            return f'jobs[{index}] must be a position name or an object'
+        for field in ('position', 'description', 'title'):
+            if job.get(field) is not None and not isinstance(job[field], str):
+                return f'jobs[{index}].{field} must be a string'
+    return None
+
+@app.route('/api/ats-scan/multi', methods=['POST'])
+def ats_scan_multi():
+    try:
+        data = request.get_json()
+        content = data.get('content')
+        jobs = data.get('jobs', [])
+        
+        if not content or not jobs:
+            return jsonify({'message': 'Resume content and jobs are required'}), 400
+        error = scan_target_error(jobs)
+        if error:
+            return jsonify({'message': error}), 400
+        if len(jobs) > MAX_SCAN_TARGETS:
+            return jsonify({'message': f'At most {MAX_SCAN_TARGETS} jobs per request; use /api/jobs for larger batches'}), 400
+        if isinstance(content, str):
+            content = json.loads(content)
+        
+        results = current_snapshot().scanner.scan_many(content, jobs)
+        return jsonify({
+            'results': results,
+            'total_jobs': len(results),
+            'analysisDate': time.time()
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'message': 'Analysis failed', 'error': str(e)}), 500
+
+# Recruiter batch scan with near-duplicate grouping
+@app.route('/api/ats-scan/batch', methods=['POST'])
+def ats_scan_batch():
+    try:
+        data = request.get_json()
+        resumes = data.get('resumes', [])
+        job_position = data.get('jobPosition', 'general')
+        threshold = float(data.get('similarityThreshold', DEFAULT_SIMILARITY_THRESHOLD))
+        job_profile_id = data.get('jobProfileId')
+        
+        if not resumes:
+            return jsonify({'message': 'At least one resume is required'}), 400
+        if len(resumes) > MAX_BATCH_RESUMES:
+            return jsonify({'message': f'At most {MAX_BATCH_RESUMES} resumes per request; use /api/jobs for larger batches'}), 400
+        if not 0 < threshold <= 1:
+            return jsonify({'message': 'similarityThreshold must be between 0 and 1'}), 400
+        
+        scan = cached_scan
+        if job_profile_id:
+            job_profile = job_profiles.get(job_profile_id)
+            if not job_profile:
+                return jsonify({'message': 'Job profile not found'}), 404
+            scan = lambda content, position: cached_scan(content, job_profile=job_profile)
+        
+        resumes = [
+            dict(r, content=json.loads(r['content']) if isinstance(r['content'], str) else r['content'])
+            for r in resumes
+        ]
+        report = scan_deduplicated(current_snapshot().scanner, resumes, job_position, threshold, scan=scan)
+        report['analysisDate'] = time.time()
+        return jsonify(report), 200
+        
+    except Exception as e:
+        return jsonify({'message': 'Analysis failed', 'error': str(e)}), 500
+
+# Background job endpoints
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    data = request.get_json()
+    job_type = data.get('type', 'scan')
+    priority = data.get('priority', 'default')
+    
+    if job_type not in JOB_HANDLERS:
+        return jsonify({'message': f'Unknown job type: {job_type}'}), 400
+    if priority not in PRIORITY_LANES:
+        return jsonify({'message': f'Unknown priority: {priority}'}), 400
+    if job_type in ('scan', 'scan_many') and not data.get('content'):
+        return jsonify({'message': 'Resume content is required'}), 400
+    if job_type == 'scan_many' and not data.get('jobs'):
+        return jsonify({'message': 'At least one job is required'}), 400
+    jobs_error = scan_target_error(data['jobs']) if job_type == 'scan_many' else None
+    if jobs_error:
+        return jsonify({'message': jobs_error}), 400
+    if job_type == 'scan_batch' and not data.get('resumes'):
+        return jsonify({'message': 'At least one resume is required'}), 400
+    if data.get('jobProfileId') and not job_profiles.get(data['jobProfileId']):
+        return jsonify({'message': 'Job profile not found'}), 404
+    
+    payload = {k: v for k, v in data.items() if k not in ('type', 'priority', 'maxAttempts')}
+    try:
+        job = job_queue.submit(job_type, payload, lane=priority, max_attempts=data.get('maxAttempts'))
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    return jsonify(job), 202
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'message': 'Job not found'}), 404
+    return jsonify(job)
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    job = job_queue.cancel(job_id)
+    if not job:
+        return jsonify({'message': 'Job not found'}), 404
+    return jsonify(job)
+
+# Job profile endpoints: compile a posting once, then scan against it by id
+@app.route('/api/job-profiles', methods=['POST'])
+def create_job_profile():
+    try:
+        data = request.get_json()
+        description = data.get('description', '')
+        
+        if not description or not isinstance(description, str):
+            return jsonify({'message': 'Job description is required'}), 400
+        if not isinstance(data.get('title', ''), str):
+            return jsonify({'message': 'title must be a string'}), 400
+        
+        snapshot = current_snapshot()
+        profile = compile_profile(
+            snapshot.scanner, description,
+            title=data.get('title', ''),
+            required_sections=data.get('requiredSections'),
+            keywords=data.get('keywords'),
+            content_version=snapshot.version,
+            taxonomy_digest=snapshot.taxonomy_digest
+        )
+        job_profiles.put(profile)
+        return jsonify(profile.to_dict()), 201
+        
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'message': 'Failed to compile job profile', 'error': str(e)}), 500
+
+@app.route('/api/job-profiles/<profile_id>', methods=['GET'])
+def get_job_profile(profile_id):
+    profile = job_profiles.get(profile_id)
+    if not profile:
+        return jsonify({'message': 'Job profile not found'}), 404
+    return jsonify(profile.to_dict())
+
 # Templates endpoints
 @app.route('/api/templates')
 def get_templates():
-    return jsonify(templates_db)
+    return jsonify(current_snapshot().templates)
 
 @app.route('/api/templates/<template_id>')
 def get_template(template_id):
-    template = next((t for t in templates_db if t['id'] == template_id), None)
+    template = find_template(template_id)
     if not template:
         return jsonify({'message': 'Template not found'}), 404
     return jsonify(template)
 
+# Template rendering endpoints
+def find_template(template_id):
+    return next((t for t in current_snapshot().templates if t['id'] == template_id), None)
+
+def request_resume_content(data):
+    content = data.get('content')
+    if isinstance(content, str):
+        content = json.loads(content)
+    return content
+
+@app.route('/api/templates/<template_id>/render', methods=['POST'])
+def render_template_html(template_id):
+    try:
+        template = find_template(template_id)
+        if not template:
+            return jsonify({'message': 'Template not found'}), 404
+        content = request_resume_content(request.get_json())
+        if not content:
+            return jsonify({'message': 'Resume content is required'}), 400
+        if not isinstance(content, dict):
+            return jsonify({'message': 'Resume content must be an object'}), 400
+        
+        return Response(render_html(compile_template(template), content), mimetype='text/html')
+        
+    except Exception as e:
+        return jsonify({'message': 'Rendering failed', 'error': str(e)}), 500
+
+@app.route('/api/templates/<template_id>/export', methods=['POST'])
+def export_template_pdf(template_id):
+    try:
+        template = find_template(template_id)
+        if not template:
+            return jsonify({'message': 'Template not found'}), 404
+        content = request_resume_content(request.get_json())
+        if not content:
+            return jsonify({'message': 'Resume content is required'}), 400
+        if not isinstance(content, dict):
+            return jsonify({'message': 'Resume content must be an object'}), 400
+        
+        pdf = render_pdf(compile_template(template), content)
+        return Response(pdf, mimetype='application/pdf',
+                        headers={'Content-Disposition': 'attachment; filename=resume.pdf'})
+        
+    except Exception as e:
+        return jsonify({'message': 'Export failed', 'error': str(e)}), 500
+
+@app.route('/api/templates/<template_id>/export/bulk', methods=['POST'])
+def export_template_bulk(template_id):
+    try:
+        template = find_template(template_id)
+        if not template:
+            return jsonify({'message': 'Template not found'}), 404
+        resumes = request.get_json().get('resumes', [])
+        if not resumes or not isinstance(resumes, list):
+            return jsonify({'message': 'At least one resume is required'}), 400
+        if len(resumes) > MAX_EXPORT_RESUMES:
+            return jsonify({'message': f'At most {MAX_EXPORT_RESUMES} resumes per export'}), 400
+        if not all(isinstance(r, dict) for r in resumes):
+            return jsonify({'message': 'Each resume must be an object'}), 400
+        
+        resumes = [dict(r, content=request_resume_content(r)) for r in resumes]
+        if not all(isinstance(r['content'], dict) for r in resumes):
+            return jsonify({'message': 'Resume content must be an object'}), 400
+        return Response(export_bulk(template, resumes), mimetype='application/zip',
+                        headers={'Content-Disposition': 'attachment; filename=resumes.zip'})
+        
+    except Exception as e:
+        return jsonify({'message': 'Export failed', 'error': str(e)}), 500
+
+@app.route('/api/templates/<template_id>/preview.svg')
+def get_template_preview(template_id):
+    template = find_template(template_id)
+    if not template:
+        return jsonify({'message': 'Template not found'}), 404
+    return Response(preview_svg(compile_template(template)), mimetype='image/svg+xml',
+                    headers={'Cache-Control': 'public, max-age=86400'})
+
 # Articles endpoints
 @app.route('/api/articles')
 def get_articles():
@@ -299,7 +896,7 @@ def get_articles():
 
 @app.route('/api/articles/<slug>')
 def get_article(slug):
-    article = next((a for a in articles_db if a['slug'] == slug), None)
+    article = articles_by_slug.get(slug)
     if not article:
         return jsonify({'message': 'Article not found'}), 404
     return jsonify(article)
@@ -407,16 +1004,11 @@ def create_article():
         data = request.get_json()
         
         # Generate slug from title
-        slug = re.sub(r'[^a-zA-Z0-9\s]', '', data['title']).lower()
-        slug = re.sub(r'\s+', '-', slug.strip())
-        
-        # Check if slug exists
-        if any(a['slug'] == slug for a in articles_db):
-            return jsonify({'message': 'Slug already exists'}), 400
+        slug = slugify(data['title'])
         
         # Create new article
         new_article = {
-            'id': str(len(articles_db) + 1),
+            'id': None,  # assigned under articles_lock
             'title': data['title'],
             'slug': slug,
             'content': data.get('content', ''),
@@ -428,7 +1020,22 @@ def create_article():
             'category': data.get('category', 'Career Tips')
         }
         
-        articles_db.append(new_article)
+        new_article['content_html'] = markdown_to_html(new_article['content'])
+        new_article['keywords'] = extract_keywords(new_article['content'])
+        
+        with articles_lock:
+            # Check if slug exists
+            if slug in articles_by_slug:
+                return jsonify({'message': 'Slug already exists'}), 400
+            
+            new_article['id'] = str(len(articles_db) + 1)
+            article_size = approx_size(new_article)
+            if article_memory['bytes'] + article_size > ARTICLES_MEMORY_BUDGET:
+                return jsonify({'message': 'Article storage budget exceeded'}), 507
+            
+            articles_db.append(new_article)
+            articles_by_slug[slug] = new_article
+            article_memory['bytes'] += article_size
         
         return jsonify({
             'message': 'Article created successfully',
@@ -442,6 +1049,200 @@ def create_article():
 def get_admin_articles():
     return jsonify(articles_db)
 
+# Bulk article import: NDJSON request body, or {"directory": "..."} of markdown files
+@app.route('/api/admin/articles/import', methods=['POST'])
+@require_admin
+def import_articles():
+    if request.mimetype == 'application/json':
+        directory = (request.get_json() or {}).get('directory', '')
+        path = safe_join(os.path.dirname(os.path.abspath(__file__)), directory)
+        if not directory or not path or not os.path.isdir(path):
+            return jsonify({'message': 'Directory not found'}), 400
+        source = iter_markdown_directory(path)
+    else:
+        source = iter_ndjson(request.stream)
+    
+    candidates = []
+    skipped = []
+    
+    # Rows are parsed and validated before taking the lock; only the checks
+    # against the live store and the append run under it
+    try:
+        for position, data in source:
+            error = article_field_error(data)
+            if error:
+                skipped.append({'source': position, 'error': error})
+                continue
+            # Supplied slugs are normalized like generated ones (hyphens kept)
+            slug = slugify(data['slug'].replace('-', ' ')) if data.get('slug') else slugify(data['title'])
+            if not slug:
+                skipped.append({'source': position, 'error': 'Empty slug'})
+                continue
+            
+            article = {
+                'id': None,
+                'title': data['title'],
+                'slug': slug,
+                'content': data.get('content') or '',
+                'excerpt': data.get('excerpt') or '',
+                'author': data.get('author') or 'Admin',
+                'created_at': data.get('created_at') or time.strftime('%Y-%m-%d'),
+                'cover_image_url': data.get('cover_image_url'),
+                'is_featured': data.get('is_featured', False),
+                'category': data.get('category', 'Career Tips')
+            }
+            candidates.append((position, article))
+    except ValueError as e:
+        return jsonify({'message': f'Invalid import data: {str(e)}', 'imported': 0}), 400
+    
+    imported = []
+    with articles_lock:
+        slugs = set(articles_by_slug)
+        next_id = len(articles_db) + 1
+        memory_used = article_memory['bytes']
+        over_budget = False
+        for position, article in candidates:
+            if article['slug'] in slugs:
+                skipped.append({'source': position, 'error': f'Slug already exists: {article["slug"]}'})
+                continue
+            article['id'] = str(next_id)
+            memory_used += approx_size(article)
+            # Once the budget is hit, every remaining row is reported rather than dropped
+            over_budget = over_budget or memory_used > ARTICLES_MEMORY_BUDGET
+            if over_budget:
+                skipped.append({'source': position, 'error': 'Article storage budget exceeded'})
+                continue
+            slugs.add(article['slug'])
+            imported.append(article)
+            next_id += 1
+        
+        # Derived fields and indexes are built once for the whole batch
+        started = time.time()
+        articles_db.extend(imported)
+        rebuild_article_indexes(imported)
+    
+    return jsonify({
+        'message': f'Imported {len(imported)} articles',
+        'imported': len(imported),
+        'skipped': skipped,
+        'rebuildSeconds': round(time.time() - started, 3)
+    }), 201 if imported else 200
+
+@app.route('/api/admin/articles/export', methods=['GET'])
+@require_admin
+def export_articles():
+    articles = list(articles_db)
+    
+    def generate():
+        for article in articles:
+            yield json.dumps(article) + '\n'
+    
+    return Response(generate(), mimetype='application/x-ndjson',
+                    headers={'Content-Disposition': 'attachment; filename=articles.ndjson'})
+
+# Admin profiling endpoints
+@app.route('/api/admin/profile', methods=['POST'])
+@require_admin
+def start_profile():
+    data = request.get_json() or {}
+    route = data.get('route')
+    if not route:
+        return jsonify({'message': 'Route is required'}), 400
+    
+    try:
+        session = profile_session.start(
+            route,
+            seconds=data.get('seconds', 30),
+            max_requests=data.get('requests'),
+            interval_ms=data.get('intervalMs', 5)
+        )
+    except (TypeError, ValueError) as e:
+        return jsonify({'message': f'Invalid profile parameters: {str(e)}'}), 400
+    _profile_state['checked_at'] = 0.0
+    return jsonify(session), 201
+
+@app.route('/api/admin/profile/<session_id>', methods=['DELETE'])
+@require_admin
+def stop_profile(session_id):
+    if not profile_session.stop(session_id):
+        return jsonify({'message': 'No active profile session with that id'}), 404
+    _profile_state['checked_at'] = 0.0
+    return jsonify({'id': session_id, 'stopped': True})
+
+@app.route('/api/admin/profile/<session_id>', methods=['GET'])
+@require_admin
+def get_profile(session_id):
+    stacks = profile_session.collect(session_id)
+    if stacks is None:
+        return jsonify({'message': 'Profile session not found'}), 404
+    
+    if request.args.get('format', 'collapsed') == 'speedscope':
+        return jsonify(to_speedscope(stacks, f'profile {session_id}'))
+    return Response(to_collapsed(stacks), mimetype='text/plain')
+
+# Admin content reload: publish a version (or re-read the current one) in every worker
+@app.route('/api/admin/content', methods=['GET'])
+@require_admin
+def get_content_version():
+    snapshot = content_snapshots.current()
+    return jsonify({
+        'version': snapshot.version,
+        'digest': snapshot.digest,
+        'taxonomyDigest': snapshot.taxonomy_digest,
+        'loaded_at': snapshot.loaded_at,
+        'available': content_snapshots.versions()
+    })
+
+@app.route('/api/admin/content/reload', methods=['POST'])
+@require_admin
+def reload_content():
+    data = request.get_json(silent=True) or {}
+    version = data.get('version') or content_snapshots.current().version
+    try:
+        snapshot = content_snapshots.reload(version)
+    except (ValueError, OSError) as e:
+        return jsonify({'message': f'Reload failed: {str(e)}'}), 400
+    return jsonify({'version': snapshot.version, 'digest': snapshot.digest,
+                    'taxonomyDigest': snapshot.taxonomy_digest, 'loaded_at': snapshot.loaded_at})
+
+# Admin memory report
+@app.route('/api/admin/memory', methods=['GET'])
+@require_admin
+def get_memory_report():
+    report = memory_report(limit=int(request.args.get('limit', 20)))
+    report['stores']['users'] = {
+        'entries': len(users_db),
+        'bytes': user_memory['bytes'],
+        'max_bytes': USERS_MEMORY_BUDGET,
+        'evictions': 0
+    }
+    report['stores']['articles'] = {
+        'entries': len(articles_db),
+        'bytes': article_memory['bytes'],
+        'max_bytes': ARTICLES_MEMORY_BUDGET,
+        'evictions': 0
+    }
+    return jsonify(report)
+
+# Admission control state of this worker
+@app.route('/api/admin/admission', methods=['GET'])
+@require_admin
+def get_admission_stats():
+    return jsonify(admission.stats())
+
+def preload():
+    """Build every read-only structure once, before gunicorn forks the workers
+    
+    Workers then share these pages with the master; gunicorn.conf.py freezes
+    them out of GC tracking so collections in the workers do not copy them.
+    """
+    snapshot = content_snapshots.current()
+    for template in snapshot.templates:
+        preview_svg(compile_template(template))
+    for name in ('index.html',):
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), 'rb') as f:
+            static_pages[name] = f.read()
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     debug_mode = os.environ.get('FLASK_ENV', 'development') == 'development'
@@ -0,0 +1,112 @@
+import json
+import os
+
+import pytest
+
+from content_snapshots import BUILTIN_VERSION, SnapshotStore
+
+BUILTIN = {'taxonomy': {}, 'templates': [], 'articles': []}
+
+TAXONOMY = {
+    'industry_keywords': {'tech': ['python', 'rust'], 'general': ['leadership']},
+    'required_sections': ['experience', 'skills']
+}
+
+
+def write_version(directory, version, taxonomy):
+    os.makedirs(os.path.join(directory, version), exist_ok=True)
+    with open(os.path.join(directory, version, 'taxonomy.json'), 'w') as f:
+        f.write(taxonomy if isinstance(taxonomy, str) else json.dumps(taxonomy))
+
+
+def read_pointer(directory):
+    with open(os.path.join(directory, 'current')) as f:
+        return f.read()
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return str(tmp_path / 'content')
+
+
+def test_reload_publishes_valid_version(directory):
+    write_version(directory, 'v1', TAXONOMY)
+    store = SnapshotStore(BUILTIN, directory)
+    snapshot = store.reload('v1')
+    assert snapshot.version == 'v1'
+    assert read_pointer(directory) == 'v1'
+    assert store.current().scanner.industry_keywords['tech'] == ['python', 'rust']
+
+
+def test_broken_version_is_not_published(directory):
+    write_version(directory, 'v1', TAXONOMY)
+    write_version(directory, 'v2', '{not json')
+    store = SnapshotStore(BUILTIN, directory)
+    store.reload('v1')
+    with pytest.raises(ValueError):
+        store.reload('v2')
+    assert read_pointer(directory) == 'v1'
+    assert store.current().version == 'v1'
+    # A new worker still starts on the last good version
+    assert SnapshotStore(BUILTIN, directory).current().version == 'v1'
+
+
+def test_taxonomy_without_general_is_rejected(directory):
+    write_version(directory, 'v1', {'industry_keywords': {'tech': ['python']}})
+    store = SnapshotStore(BUILTIN, directory)
+    with pytest.raises(ValueError, match='general'):
+        store.reload('v1')
+    assert store.current().version == BUILTIN_VERSION
+
+
+def test_unknown_version_is_rejected(directory):
+    store = SnapshotStore(BUILTIN, directory)
+    with pytest.raises(ValueError):
+        store.reload('missing')
+
+
+def test_current_keeps_old_snapshot_when_pointer_target_breaks(directory):
+    write_version(directory, 'v1', TAXONOMY)
+    store = SnapshotStore(BUILTIN, directory, check_interval=0)
+    store.reload('v1')
+    write_version(directory, 'v1', '{broken')
+    store.request_reload()
+    assert store.current().version == 'v1'
+    assert store.current().scanner.industry_keywords['tech'] == ['python', 'rust']
+
+
+def test_broken_pointer_at_startup_falls_back_to_builtin(directory):
+    write_version(directory, 'v1', '{broken')
+    with open(os.path.join(directory, 'current'), 'w') as f:
+        f.write('v1')
+    assert SnapshotStore(BUILTIN, directory).current().version == BUILTIN_VERSION
+
+
+def test_in_place_edit_changes_digest(directory):
+    write_version(directory, 'v1', TAXONOMY)
+    store = SnapshotStore(BUILTIN, directory)
+    before = store.reload('v1')
+    edited = dict(TAXONOMY, industry_keywords={'tech': ['python', 'rust', 'go'], 'general': ['leadership']})
+    write_version(directory, 'v1', edited)
+    after = store.reload('v1')
+    assert after.version == before.version
+    assert after.digest != before.digest
+    assert after.taxonomy_digest != before.taxonomy_digest
+
+
+def test_article_edit_keeps_taxonomy_digest(directory):
+    write_version(directory, 'v1', TAXONOMY)
+    store = SnapshotStore(BUILTIN, directory)
+    before = store.reload('v1')
+    with open(os.path.join(directory, 'v1', 'articles.json'), 'w') as f:
+        json.dump([{'slug': 'new', 'title': 'New'}], f)
+    after = store.reload('v1')
+    assert after.digest != before.digest
+    assert after.taxonomy_digest == before.taxonomy_digest
+
+
+def test_taxonomy_digest_ignores_templates_and_articles():
+    web = SnapshotStore({'taxonomy': {}, 'templates': [{'id': '1'}], 'articles': [{'slug': 'a'}]}, '/nonexistent')
+    jobs = SnapshotStore(BUILTIN, '/nonexistent')
+    assert web.current().digest != jobs.current().digest
+    assert web.current().taxonomy_digest == jobs.current().taxonomy_digest
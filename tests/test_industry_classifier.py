@@ -0,0 +1,50 @@
+import numpy as np
+from scipy import sparse
+from sklearn.linear_model import SGDClassifier
+
+from industry_classifier import IndustryClassifier, make_vectorizer
+
+CORPUS = [
+    ('python django api backend services', 'technology'),
+    ('kubernetes docker cloud infrastructure', 'technology'),
+    ('react frontend javascript web apps', 'technology'),
+    ('patient care nursing hospital clinic', 'healthcare'),
+    ('medical records clinical trials patients', 'healthcare'),
+    ('pharmacy prescriptions hospital staff', 'healthcare'),
+    ('financial statements audit accounting', 'finance'),
+    ('portfolio investment banking equity', 'finance'),
+    ('budget forecasting tax accounting', 'finance'),
+]
+
+TEXTS = ['python api cloud', 'hospital patients', 'tax audit', 'completely unrelated words']
+
+
+def fit(corpus):
+    vectorizer = make_vectorizer()
+    model = SGDClassifier(loss='log_loss', alpha=1e-4, max_iter=50, tol=None, random_state=0)
+    model.fit(vectorizer.transform([t for t, _ in corpus]), [label for _, label in corpus])
+    classifier = IndustryClassifier(
+        classes=[str(c) for c in model.classes_],
+        weights=sparse.csr_matrix(model.coef_.T.astype(np.float32)),
+        intercept=model.intercept_.astype(np.float32)
+    )
+    return model, classifier, vectorizer
+
+
+def test_probabilities_match_sklearn_ovr():
+    model, classifier, vectorizer = fit(CORPUS)
+    expected = model.predict_proba(vectorizer.transform(TEXTS))
+    np.testing.assert_allclose(classifier.predict_proba(TEXTS), expected, rtol=1e-4, atol=1e-5)
+
+
+def test_binary_probabilities_match_sklearn():
+    model, classifier, vectorizer = fit([e for e in CORPUS if e[1] != 'finance'])
+    expected = model.predict_proba(vectorizer.transform(TEXTS))
+    np.testing.assert_allclose(classifier.predict_proba(TEXTS), expected, rtol=1e-4, atol=1e-5)
+
+
+def test_predict_returns_best_class_and_its_probability():
+    _, classifier, _ = fit(CORPUS)
+    industry, confidence = classifier.predict(['python api cloud'])[0]
+    assert industry == 'technology'
+    assert 0 < confidence <= 1
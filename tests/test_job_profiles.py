@@ -0,0 +1,61 @@
+import pytest
+
+from ats_scanner import ATSScanner
+from job_profiles import JobProfileStore, compile_profile
+
+DESCRIPTION = 'Python developer with AWS and Docker experience'
+
+
+@pytest.fixture(scope='module')
+def scanner():
+    return ATSScanner()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobProfileStore(str(tmp_path / 'profiles'))
+
+
+def test_id_follows_taxonomy_not_version(scanner):
+    first = compile_profile(scanner, DESCRIPTION, content_version='v1', taxonomy_digest='aaaa')
+    renamed = compile_profile(scanner, DESCRIPTION, content_version='v2', taxonomy_digest='aaaa')
+    edited = compile_profile(scanner, DESCRIPTION, content_version='v1', taxonomy_digest='bbbb')
+    assert first.id == renamed.id
+    assert first.id != edited.id
+
+
+def test_put_then_get_from_disk(scanner, store):
+    profile = compile_profile(scanner, DESCRIPTION, content_version='v1', taxonomy_digest='aaaa')
+    store.put(profile)
+    reader = JobProfileStore(store.directory)
+    assert reader.get(profile.id).weights == profile.weights
+
+
+@pytest.mark.parametrize('profile_id', [123, None, ['abc'], {'id': 'abc'}, '../abc', ''])
+def test_get_rejects_malformed_ids(store, profile_id):
+    assert store.get(profile_id) is None
+
+
+@pytest.mark.parametrize('overrides', [
+    {'keywords': {'python': -5, 'rust': 1}},
+    {'keywords': {'python': 0}},
+    {'keywords': {'python': float('inf')}},
+    {'keywords': {'python': '2'}},
+    {'keywords': {'python': True}},
+    {'keywords': [1, 2]},
+    {'keywords': ['']},
+    {'keywords': 'python'},
+    {'required_sections': 'skills'},
+    {'required_sections': ['skills', 3]},
+])
+def test_compile_rejects_invalid_overrides(scanner, overrides):
+    with pytest.raises(ValueError):
+        compile_profile(scanner, DESCRIPTION, **overrides)
+
+
+def test_compile_applies_valid_overrides(scanner):
+    profile = compile_profile(scanner, DESCRIPTION, required_sections=['skills'],
+                              keywords={'rust': 2, 'go': 0.5})
+    assert profile.required_sections == ['skills']
+    assert profile.weights['rust'] == 2.0
+    assert profile.keywords[0] == 'rust'
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from job_queue import JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / 'jobs.db'), max_attempts=2, backoff_base=0.0, lease_seconds=60)
+
+
+def expire_lease(queue, job_id):
+    with queue._connect() as conn:
+        conn.execute('UPDATE jobs SET lease_expires = ? WHERE id = ?', (time.time() - 1, job_id))
+
+
+def test_claim_takes_highest_priority_lane_first(queue):
+    queue.submit('scan', {'n': 1}, lane='batch')
+    interactive = queue.submit('scan', {'n': 2}, lane='interactive')
+    assert queue.claim('w1')['id'] == interactive['id']
+
+
+def test_complete_stores_result(queue):
+    job = queue.submit('scan', {})
+    claimed = queue.claim('w1')
+    assert claimed['attempts'] == 1
+    assert queue.complete(job['id'], 'w1', {'score': 80})
+    stored = queue.get(job['id'])
+    assert stored['status'] == 'succeeded'
+    assert stored['result'] == {'score': 80}
+
+
+def test_fail_retries_then_gives_up(queue):
+    job = queue.submit('scan', {})
+    queue.claim('w1')
+    assert queue.fail(job['id'], 'w1', 'boom')
+    assert queue.get(job['id'])['status'] == 'queued'
+    queue.claim('w1')
+    queue.fail(job['id'], 'w1', 'boom again')
+    stored = queue.get(job['id'])
+    assert stored['status'] == 'failed'
+    assert stored['error'] == 'boom again'
+    assert queue.claim('w1') is None
+
+
+def test_expired_lease_is_reclaimed(queue):
+    job = queue.submit('scan', {})
+    queue.claim('w1')
+    expire_lease(queue, job['id'])
+    reclaimed = queue.claim('w2')
+    assert reclaimed['id'] == job['id']
+    assert reclaimed['attempts'] == 2
+
+
+def test_expired_lease_on_last_attempt_fails_job(queue):
+    job = queue.submit('scan', {})
+    queue.claim('w1')
+    expire_lease(queue, job['id'])
+    queue.claim('w2')
+    expire_lease(queue, job['id'])
+    assert queue.claim('w3') is None
+    stored = queue.get(job['id'])
+    assert stored['status'] == 'failed'
+    assert stored['attempts'] == 2
+
+
+def test_stale_leaseholder_cannot_overwrite(queue):
+    job = queue.submit('scan', {})
+    queue.claim('w1')
+    expire_lease(queue, job['id'])
+    queue.claim('w2')
+    assert not queue.complete(job['id'], 'w1', {'stale': True})
+    assert not queue.fail(job['id'], 'w1', 'stale')
+    assert queue.get(job['id'])['status'] == 'running'
+    assert queue.complete(job['id'], 'w2', {'fresh': True})
+    assert queue.get(job['id'])['result'] == {'fresh': True}
+
+
+def test_cancel_queued_and_running(queue):
+    queued = queue.submit('scan', {})
+    assert queue.cancel(queued['id'])['status'] == 'cancelled'
+    running = queue.submit('scan', {})
+    queue.claim('w1')
+    assert queue.cancel(running['id'])['cancelRequested']
+    queue.complete(running['id'], 'w1', {'score': 1})
+    stored = queue.get(running['id'])
+    assert stored['status'] == 'cancelled'
+    assert stored['result'] is None
+
+
+@pytest.mark.parametrize('max_attempts', ['abc', '3', 0, 11, 2.5, True])
+def test_submit_rejects_bad_max_attempts(queue, max_attempts):
+    with pytest.raises(ValueError):
+        queue.submit('scan', {}, max_attempts=max_attempts)
+
+
+def test_submit_accepts_max_attempts_in_range(queue):
+    assert queue.submit('scan', {}, max_attempts=5)['maxAttempts'] == 5
+    assert queue.submit('scan', {})['maxAttempts'] == 2
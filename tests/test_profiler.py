@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from profiler import ProfileSession, StackSampler
+
+SESSION = {'id': 'abc123', 'interval_ms': 1}
+
+
+def busy(seconds):
+    until = time.time() + seconds
+    while time.time() < until:
+        pass
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    return ProfileSession(str(tmp_path / 'profiles'))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'seconds': 'abc'}, {'seconds': 0}, {'seconds': 7200},
+    {'max_requests': 'many'}, {'max_requests': 0},
+    {'interval_ms': 0}, {'interval_ms': 5000},
+])
+def test_start_rejects_out_of_range_parameters(sessions, kwargs):
+    with pytest.raises(ValueError):
+        sessions.start('/api/ats-scan', **kwargs)
+
+
+def test_stop_ends_matching_session_only(sessions):
+    session = sessions.start('/api/ats-scan', seconds=60)
+    assert not sessions.stop('other')
+    assert sessions.active()['id'] == session['id']
+    assert sessions.stop(session['id'])
+    assert sessions.active() is None
+
+
+def test_sampler_thread_exits_and_restarts():
+    sampler = StackSampler()
+    sampler.begin(SESSION)
+    busy(0.02)
+    sampler.end()
+    first = sampler._thread
+    if first is not None:
+        first.join(1)
+    assert sampler._thread is None
+
+    sampler.begin(SESSION)
+    assert sampler._thread is not None and sampler._thread is not first
+    sampled = sum(sampler.stacks.values())
+    busy(0.02)
+    assert sum(sampler.end().values()) > sampled
+
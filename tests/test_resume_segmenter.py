@@ -0,0 +1,63 @@
+from resume_segmenter import segment_resume
+
+
+def test_inline_header_content_goes_to_its_section():
+    content = segment_resume('Jane Doe\njane@example.com\nSkills: Python, SQL, AWS\nSummary: Backend engineer')
+    assert content['skills'] == ['Python', 'SQL', 'AWS']
+    assert content['summary'] == 'Backend engineer'
+    assert 'Skills' not in content['contact']
+
+
+def test_header_alone_on_its_line():
+    content = segment_resume('## Technical Skills:\nPython; Go\n\nWORK EXPERIENCE\nEngineer at Acme')
+    assert content['skills'] == ['Python', 'Go']
+    assert content['experience'][0]['title'] == 'Engineer'
+
+
+def test_header_word_without_colon_is_content():
+    content = segment_resume('Experience\nEngineer at Acme\nExperience building APIs')
+    assert len(content['experience']) == 1
+    assert content['experience'][0]['description'] == 'Experience building APIs'
+
+
+def test_preamble_with_contact_details_is_contact():
+    content = segment_resume('Jane Doe\n+1 (555) 123-4567\n\nSkills\nPython')
+    assert content['contact'] == 'Jane Doe | +1 (555) 123-4567'
+    assert 'summary' not in content
+
+
+def test_preamble_without_contact_details_is_summary():
+    content = segment_resume('Engineer who ships reliable services\n\nSkills\nPython')
+    assert content['summary'] == 'Engineer who ships reliable services'
+    assert 'contact' not in content
+
+
+def test_preamble_does_not_replace_explicit_summary():
+    content = segment_resume('Some intro line\n\nSummary\nSeasoned developer')
+    assert content['summary'] == 'Seasoned developer'
+
+
+def test_roles_split_into_title_company_and_description():
+    content = segment_resume(
+        'Experience\n'
+        'Senior Engineer at Acme Corp\n- Led the platform team\n- Cut costs 30%\n\n'
+        'Developer | Initech\nWrote reports\n\n'
+        'Education\nBSc Computer Science, State University'
+    )
+    assert content['experience'] == [
+        {'title': 'Senior Engineer', 'company': 'Acme Corp', 'description': 'Led the platform team Cut costs 30%'},
+        {'title': 'Developer', 'company': 'Initech', 'description': 'Wrote reports'},
+    ]
+    assert content['education'] == [
+        {'degree': 'BSc Computer Science', 'school': 'State University', 'description': ''}
+    ]
+
+
+def test_skills_split_and_deduplicated():
+    content = segment_resume('Skills\n• Python, SQL\n- Docker | Python\nAWS; Kubernetes')
+    assert content['skills'] == ['Python', 'SQL', 'Docker', 'AWS', 'Kubernetes']
+
+
+def test_other_sections_collected():
+    content = segment_resume('Certifications: AWS Solutions Architect\nProjects\nOpen source CLI')
+    assert content['other'] == 'AWS Solutions Architect Open source CLI'
@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return str(tmp_path / 'inflight')
+
+
+def run_in_thread(fn):
+    outcome = {}
+
+    def target():
+        try:
+            outcome['value'] = fn()
+        except Exception as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    return thread, outcome
+
+
+def test_concurrent_calls_share_one_computation(directory):
+    flight = SingleFlight(directory)
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(2)
+        return {'score': 42}
+
+    threads = [run_in_thread(lambda: flight.do('k', compute)) for _ in range(5)]
+    time.sleep(0.1)
+    release.set()
+    for thread, outcome in threads:
+        thread.join()
+        assert outcome['value'] == {'score': 42}
+    assert len(calls) == 1
+
+
+def test_waiter_computes_locally_when_leader_is_stuck(directory):
+    flight = SingleFlight(directory, timeout=0.1)
+    release = threading.Event()
+    leader, leader_outcome = run_in_thread(lambda: flight.do('k', lambda: release.wait(2) and 'leader'))
+    time.sleep(0.02)
+    assert flight.do('k', lambda: 'local') == 'local'
+    release.set()
+    leader.join()
+    assert leader_outcome['value'] == 'leader'
+
+
+def test_waiters_get_leader_failure_with_original_type(directory):
+    flight = SingleFlight(directory)
+    release = threading.Event()
+
+    def failing():
+        release.wait(2)
+        raise ValueError('bad resume')
+
+    leader, leader_outcome = run_in_thread(lambda: flight.do('k', failing))
+    time.sleep(0.02)
+    waiter, waiter_outcome = run_in_thread(lambda: flight.do('k', lambda: 'unused'))
+    time.sleep(0.02)
+    release.set()
+    leader.join()
+    waiter.join()
+    assert isinstance(leader_outcome['error'], ValueError)
+    assert isinstance(waiter_outcome['error'], ValueError)
+
+
+def test_failure_is_not_replayed_to_later_calls(directory):
+    flight = SingleFlight(directory)
+
+    def failing():
+        raise ValueError('transient')
+
+    with pytest.raises(ValueError):
+        flight.do('k', failing)
+    assert flight.do('k', lambda: 'recovered') == 'recovered'
+
+    # Another process (separate lease file handle) must not see the old failure either
+    other = SingleFlight(directory)
+    with pytest.raises(ValueError):
+        flight.do('j', failing)
+    assert other.do('j', lambda: 'fresh') == 'fresh'
+
+
+def test_cross_process_waiter_gets_failure_it_waited_on(directory):
+    # Separate instances take separate flock leases, like separate workers
+    first, second = SingleFlight(directory), SingleFlight(directory)
+    release = threading.Event()
+
+    def failing():
+        release.wait(2)
+        raise ValueError('bad resume')
+
+    leader, leader_outcome = run_in_thread(lambda: first.do('k', failing))
+    time.sleep(0.05)
+    waiter, waiter_outcome = run_in_thread(lambda: second.do('k', lambda: 'unused'))
+    time.sleep(0.05)
+    release.set()
+    leader.join()
+    waiter.join()
+    assert isinstance(leader_outcome['error'], ValueError)
+    assert isinstance(waiter_outcome['error'], RuntimeError)
+    assert 'ValueError: bad resume' in str(waiter_outcome['error'])
+
+
+def test_success_is_shared_across_processes_while_fresh(directory):
+    first, second = SingleFlight(directory), SingleFlight(directory)
+    assert first.do('k', lambda: [1, 2]) == [1, 2]
+    assert second.do('k', lambda: 'recomputed') == [1, 2]